@@ -12,17 +12,28 @@ Usage:
 """
 
 import argparse
+import contextlib
+import functools
+import hashlib
+import itertools
 import json
+import operator
 import os
+import platform
 import re
+import select
 import shutil
 import socket
 import subprocess
 import sys
-import tempfile
+import termios
+import threading
 import time
+import tty
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 from typing import Any, Literal
 
@@ -48,6 +59,12 @@ TARGET_HEIGHT = 1080
 TARGET_FPS = 30
 TRANSITION_DURATION = 1  # seconds
 
+# VideoToolbox hardware encoders (share quality flags and decode args)
+_VT_ENCODERS = frozenset({"hevc_videotoolbox", "h264_videotoolbox"})
+
+# GPU encoder priority order consulted by the detection helpers
+_GPU_PRIORITY: tuple[str, ...] = ("hevc_videotoolbox", "h264_videotoolbox")
+
 # Human-readable encoder names for user feedback
 ENCODER_NAMES = {
     "hevc_videotoolbox": "VideoToolbox HEVC (GPU)",
@@ -90,6 +107,12 @@ class SelectionState:
     decisions: list[VideoDecision]
     current_index: int = 0
     should_quit: bool = False
+    _kept: int = 0
+    _skipped: int = 0
+
+    def __post_init__(self) -> None:
+        self._kept = sum(1 for d in self.decisions if d.decision == "keep")
+        self._skipped = sum(1 for d in self.decisions if d.decision == "skip")
 
     @property
     def current_video(self) -> VideoDecision:
@@ -104,12 +127,27 @@ class SelectionState:
     @property
     def kept_count(self) -> int:
         """Number of videos marked as keep."""
-        return sum(1 for d in self.decisions if d.decision == "keep")
+        return self._kept
 
     @property
     def skipped_count(self) -> int:
         """Number of videos marked as skip."""
-        return sum(1 for d in self.decisions if d.decision == "skip")
+        return self._skipped
+
+    def set_decision(self, index: int, decision: DecisionType) -> None:
+        """Record a decision, keeping the O(1) kept/skipped counters in sync."""
+        old = self.decisions[index].decision
+        if old == decision:
+            return
+        if old == "keep":
+            self._kept -= 1
+        elif old == "skip":
+            self._skipped -= 1
+        if decision == "keep":
+            self._kept += 1
+        elif decision == "skip":
+            self._skipped += 1
+        self.decisions[index].decision = decision
 
     def has_next(self) -> bool:
         """Check if there's a next video to review."""
@@ -122,56 +160,196 @@ class SelectionState:
 
 # Encoder cache to avoid repeated tests
 _encoder_cache: dict[str, tuple] = {}
+_encoder_cache_lock = threading.Lock()
+
+# On-disk encoder cache so warm CLI runs skip probing entirely
+ENCODER_CACHE_PATH = Path.home() / ".cache" / "montage" / "encoders.json"
+_encoder_cache_loaded = False
+
+# Cached parse of `ffmpeg -encoders` output (None until first call)
+_ffmpeg_encoders: set[str] | None = None
+
+# Cached parse of `ffmpeg -hwaccels` output (None until first call)
+_ffmpeg_hwaccels: set[str] | None = None
+
+# Matches the encoder rows of `ffmpeg -encoders` output, e.g.
+# " V....D hevc_videotoolbox    VideoToolbox H.265 Encoder"
+_ENCODER_LINE_RE = re.compile(r"^ [AV.][.FSXBD]{5}\s+([\w-]+)", re.M)
+
+# When True (set via --strict-probe), verify listed encoders with a real
+# test encode instead of trusting the `ffmpeg -encoders` listing.
+_strict_probe = False
 
 console = Console()
 
 
-def _test_encoder(encoder: str, timeout: int = 10) -> bool:
-    """Test if an encoder is available by attempting a 1-second encode."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        test_output = Path(tmpdir) / "test.mp4"
+def _list_ffmpeg_encoders() -> set[str]:
+    """Return the set of encoder names compiled into the local ffmpeg.
+
+    Runs `ffmpeg -encoders` once per process and caches the parsed result.
+    This is an order of magnitude cheaper than a test encode per candidate.
+    Returns an empty set when ffmpeg is missing or fails.
+    """
+    global _ffmpeg_encoders
+    if _ffmpeg_encoders is None:
+        try:
+            proc = subprocess.run(
+                ["ffmpeg", "-hide_banner", "-encoders"],
+                capture_output=True,
+                text=True,
+                timeout=10,
+            )
+            _ffmpeg_encoders = set(_ENCODER_LINE_RE.findall(proc.stdout))
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            _ffmpeg_encoders = set()
+    return _ffmpeg_encoders
 
-        # Generate test pattern and encode
-        cmd = [
-            "ffmpeg",
-            "-y",
-            "-hide_banner",
-            "-loglevel",
-            "error",
-            "-f",
-            "lavfi",
-            "-i",
-            "testsrc=duration=1:size=320x240:rate=30",
-            "-c:v",
-            encoder,
-            "-t",
-            "1",
-            str(test_output),
-        ]
 
-        # Add encoder-specific flags for VideoToolbox
-        if encoder in ("hevc_videotoolbox", "h264_videotoolbox"):
-            cmd.insert(-1, "-allow_sw")
-            cmd.insert(-1, "1")  # Allow software fallback for older Macs
+def _list_ffmpeg_hwaccels() -> set[str]:
+    """Return the hardware acceleration methods the local ffmpeg supports.
 
+    Runs `ffmpeg -hwaccels` once per process and caches the parsed result.
+    Returns an empty set when ffmpeg is missing or fails.
+    """
+    global _ffmpeg_hwaccels
+    if _ffmpeg_hwaccels is None:
         try:
-            subprocess.run(cmd, capture_output=True, timeout=timeout, check=True)
-            return test_output.exists() and test_output.stat().st_size > 0
-        except (
-            subprocess.CalledProcessError,
-            subprocess.TimeoutExpired,
-            FileNotFoundError,
-        ):
-            return False
+            proc = subprocess.run(
+                ["ffmpeg", "-hide_banner", "-hwaccels"],
+                capture_output=True,
+                text=True,
+                timeout=10,
+            )
+            # First line is the "Hardware acceleration methods:" header
+            _ffmpeg_hwaccels = {
+                line.strip() for line in proc.stdout.splitlines()[1:] if line.strip()
+            }
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            _ffmpeg_hwaccels = set()
+    return _ffmpeg_hwaccels
+
+
+def _encoder_cache_fingerprint() -> str | None:
+    """Fingerprint the host's ffmpeg install for the on-disk encoder cache.
+
+    The encoder set only changes when ffmpeg itself (or macOS) changes, so
+    hashing the binary path, its mtime, and the macOS version is enough to
+    invalidate stale entries.
+    """
+    ffmpeg_path = shutil.which("ffmpeg")
+    if ffmpeg_path is None:
+        return None
+    try:
+        mtime = os.path.getmtime(ffmpeg_path)
+    except OSError:
+        return None
+    key = f"{ffmpeg_path}:{mtime}:{platform.mac_ver()[0]}"
+    return hashlib.sha1(key.encode()).hexdigest()
+
+
+def _load_encoder_cache() -> None:
+    """Populate _encoder_cache from disk when the host fingerprint matches.
+
+    Runs at most once per process; corrupt or stale cache files are ignored.
+    """
+    global _encoder_cache_loaded
+    if _encoder_cache_loaded:
+        return
+    _encoder_cache_loaded = True
+
+    fingerprint = _encoder_cache_fingerprint()
+    if fingerprint is None:
+        return
+    try:
+        data = json.loads(ENCODER_CACHE_PATH.read_text())
+    except (OSError, json.JSONDecodeError):
+        return
+    if data.get("fingerprint") != fingerprint:
+        return
+
+    with _encoder_cache_lock:
+        for key, value in data.get("results", {}).items():
+            _encoder_cache.setdefault(key, tuple(value))
+
+
+def _save_encoder_cache() -> None:
+    """Write _encoder_cache to disk atomically, keyed by host fingerprint."""
+    fingerprint = _encoder_cache_fingerprint()
+    if fingerprint is None or not _encoder_cache:
+        return
+
+    with _encoder_cache_lock:
+        results = {key: list(value) for key, value in _encoder_cache.items()}
+    data = {"fingerprint": fingerprint, "results": results}
+
+    try:
+        ENCODER_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = ENCODER_CACHE_PATH.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(data))
+        os.replace(tmp_path, ENCODER_CACHE_PATH)
+    except OSError:
+        pass  # Cache is best-effort; probing still works without it
+
+
+def _test_encoder(encoder: str, timeout: int = 5) -> tuple[str, bool]:
+    """Test if an encoder is available by encoding a single frame.
+
+    Returns (encoder, ok) so concurrent callers can match results to probes.
+    The encode targets ffmpeg's null muxer, so no temp directory or output
+    file is needed - the return code alone answers the capability question.
+    One frame is enough: encoder init is the failure mode being probed.
+    """
+    # Generate test pattern and encode to the null muxer
+    cmd = [
+        "ffmpeg",
+        "-y",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-f",
+        "lavfi",
+        "-i",
+        "testsrc=duration=1:size=320x240:rate=30",
+        "-c:v",
+        encoder,
+    ]
+
+    # Add encoder-specific flags for VideoToolbox
+    if encoder in ("hevc_videotoolbox", "h264_videotoolbox"):
+        cmd += ["-allow_sw", "1"]  # Allow software fallback for older Macs
+
+    cmd += ["-frames:v", "1", "-f", "null", "-"]
+
+    try:
+        # Only the return code matters; discard output in the kernel rather
+        # than accumulating ffmpeg's chatter in Python-side buffers.
+        subprocess.run(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=timeout,
+            check=True,
+        )
+        return encoder, True
+    except (
+        subprocess.CalledProcessError,
+        subprocess.TimeoutExpired,
+        FileNotFoundError,
+    ):
+        return encoder, False
 
 
+@functools.lru_cache(maxsize=4)
 def _get_encoder_settings(encoder: str) -> dict:
-    """Get optimal settings for each encoder type."""
-    if encoder == "hevc_videotoolbox" or encoder == "h264_videotoolbox":
+    """Get optimal settings for each encoder type (memoized per encoder)."""
+    if encoder in _VT_ENCODERS:
         return {
             "quality_flag": "-q:v",
             "quality_values": {"high": "50", "balanced": "60", "fast": "70"},
             "extra_args": ["-allow_sw", "1"],
+            # Decode on the Apple media engine too - software HEVC decode
+            # dominates CPU on Intel Macs (applied per input when supported)
+            "input_args": ["-hwaccel", "videotoolbox", "-extra_hw_frames", "8"],
             "pix_fmt": "yuv420p",
         }
     else:  # libx265 (CPU fallback)
@@ -180,6 +358,7 @@ def _get_encoder_settings(encoder: str) -> dict:
             "quality_values": {"high": "20", "balanced": "22", "fast": "24"},
             "presets": {"high": "slow", "balanced": "medium", "fast": "fast"},
             "extra_args": [],
+            "input_args": [],
             "pix_fmt": "yuv420p10le",  # CPU supports 10-bit
         }
 
@@ -189,34 +368,47 @@ def detect_best_encoder(codec: str = "hevc") -> tuple[str, dict, list[str]]:
     Detect the best available encoder for macOS.
     Returns (encoder_name, encoder_settings, tested_encoders).
 
-    Tests VideoToolbox encoders in priority order, falls back to CPU.
-    Results are cached for the session.
+    Consults the `ffmpeg -encoders` listing in priority order, falls back
+    to CPU. With --strict-probe, listed encoders are additionally verified
+    with a real test encode. Results are cached for the session.
 
     Encoder priority:
     1. hevc_videotoolbox - HEVC hardware (Macs 2017+, Apple Silicon)
     2. h264_videotoolbox - H.264 hardware (broader support, Macs 2011+)
     3. libx265 - CPU fallback (works on all Macs)
     """
-    cache_key = f"darwin_{codec}"
+    # The strict flag is part of the key: a warm non-strict entry (including
+    # one loaded from disk) must not satisfy a --strict-probe run, whose
+    # whole point is re-verifying encoders after a suspect encode.
+    cache_key = f"darwin_{codec}_strict" if _strict_probe else f"darwin_{codec}"
+    _load_encoder_cache()
     if cache_key in _encoder_cache:
         return _encoder_cache[cache_key]
 
-    tested = []  # Track what we tested for user feedback
-
     # macOS encoder priority: HEVC GPU -> H.264 GPU -> CPU
-    hw_encoders = ["hevc_videotoolbox", "h264_videotoolbox"]
-
-    # Test each hardware encoder
-    for encoder in hw_encoders:
-        tested.append(encoder)
-        if _test_encoder(encoder):
-            result = (encoder, _get_encoder_settings(encoder), tested)
-            _encoder_cache[cache_key] = result
-            return result
-
-    # Fallback to CPU
-    result = ("libx265", _get_encoder_settings("libx265"), tested)
-    _encoder_cache[cache_key] = result
+    tested = list(_GPU_PRIORITY)  # Track what we tested for user feedback
+
+    listed = _list_ffmpeg_encoders()
+    candidates = [enc for enc in _GPU_PRIORITY if enc in listed]
+
+    # On Apple Silicon, VideoToolbox is part of the SoC - if ffmpeg lists
+    # the encoder it works, so skip test encodes even under --strict-probe.
+    if _strict_probe and candidates and platform.machine() != "arm64":
+        # Verify with real (concurrent) test encodes - catches the rare case
+        # where an encoder is linked in but fails to initialize.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = {enc: executor.submit(_test_encoder, enc) for enc in candidates}
+            candidates = [enc for enc in candidates if futures[enc].result()[1]]
+
+    if candidates:
+        result = (candidates[0], _get_encoder_settings(candidates[0]), tested)
+    else:
+        # Fallback to CPU
+        result = ("libx265", _get_encoder_settings("libx265"), tested)
+
+    with _encoder_cache_lock:
+        _encoder_cache[cache_key] = result
+    _save_encoder_cache()
     return result
 
 
@@ -224,36 +416,117 @@ def _test_gpu_availability() -> tuple[bool, str | None, dict | None]:
     """
     Test GPU encoder availability without falling back to CPU.
 
+    Results are cached in-process and on disk alongside detect_best_encoder.
+
     Returns:
         (is_available, encoder_name, encoder_settings) or (False, None, None)
     """
-    for encoder in ["hevc_videotoolbox", "h264_videotoolbox"]:
-        if _test_encoder(encoder):
-            return (True, encoder, _get_encoder_settings(encoder))
-    return (False, None, None)
+    # Strict results live under their own key, as in detect_best_encoder
+    cache_key = "darwin_gpu_strict" if _strict_probe else "darwin_gpu"
+    _load_encoder_cache()
+    if cache_key in _encoder_cache:
+        return _encoder_cache[cache_key]
+
+    listed = _list_ffmpeg_encoders()
+    candidates = [enc for enc in _GPU_PRIORITY if enc in listed]
+
+    # Same Apple Silicon shortcut as detect_best_encoder: the listing alone
+    # is authoritative on arm64, so no test encode is needed there.
+    if _strict_probe and candidates and platform.machine() != "arm64":
+        # Same concurrent verification as detect_best_encoder: overlap the
+        # subprocess waits, then honor priority order when consuming results.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = {enc: executor.submit(_test_encoder, enc) for enc in candidates}
+            candidates = [enc for enc in candidates if futures[enc].result()[1]]
+
+    result: tuple[bool, str | None, dict | None]
+    if candidates:
+        result = (True, candidates[0], _get_encoder_settings(candidates[0]))
+    else:
+        result = (False, None, None)
+
+    with _encoder_cache_lock:
+        _encoder_cache[cache_key] = result
+    _save_encoder_cache()
+    return result
+
+
+def _clip_signature(video: Any) -> tuple | None:
+    """Return (codec, width, height, fps) for a clip, or None if unknown.
+
+    Accepts either a playlist entry (dict) or an osxphotos object. Rotated
+    playlist entries report None since they always need a re-encode.
+    """
+    if isinstance(video, dict):
+        if video.get("rotation", 0) != 0:
+            return None
+        return (
+            video.get("codec"),
+            video.get("width"),
+            video.get("height"),
+            video.get("fps"),
+        )
+
+    exif = video.exif_info
+    if exif is None:
+        return None
+    return (
+        getattr(exif, "codec", None),
+        video.width,
+        video.height,
+        getattr(exif, "fps", None),
+    )
+
+
+def _clips_are_uniform(videos: list) -> bool:
+    """Check whether all clips share codec, dimensions, and frame rate.
+
+    Uniform clips are eligible for concat-demuxer stream copy (mux-only,
+    no re-encode) when transitions are disabled.
+    """
+    if not videos:
+        return False
+
+    signatures = {_clip_signature(v) for v in videos}
+    if len(signatures) != 1:
+        return False
+
+    signature = signatures.pop()
+    return signature is not None and None not in signature
 
 
+# Hoisted formatting constants - these sit on per-video hot paths
+# (summary table, review status line) and shouldn't be rebuilt per call.
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+_DATE_FMT = "%Y-%m-%d %H:%M"
+_by_date = operator.attrgetter("date")
+
+
+# Both formatters are memoized: the selection loop re-renders the same
+# video's metadata on every Rotate press, and summary tables repeat
+# identical values across rows.
+@functools.lru_cache(maxsize=1024)
 def format_size(size_bytes: int | None) -> str:
     """Format bytes to human readable size."""
     if size_bytes is None:
         return "Unknown"
-    size: float = float(size_bytes)
-    for unit in ["B", "KB", "MB", "GB"]:
-        if size < 1024:
-            return f"{size:.1f} {unit}"
-        size /= 1024
-    return f"{size:.1f} TB"
+    if size_bytes <= 0:
+        return "0.0 B"
+    # Unit boundaries are powers of 1024, so the unit index falls straight
+    # out of the bit length - no division loop needed.
+    idx = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (idx * 10)):.1f} {_SIZE_UNITS[idx]}"
 
 
+@functools.lru_cache(maxsize=1024)
 def format_duration(seconds: float) -> str:
     """Format seconds to human readable duration."""
     if seconds is None:
         return "Unknown"
     if seconds < 60:
         return f"{seconds:.1f}s"
-    minutes = int(seconds // 60)
-    secs = seconds % 60
-    return f"{minutes}m {secs:.0f}s"
+    minutes, secs = divmod(seconds, 60)
+    return f"{int(minutes)}m {secs:.0f}s"
 
 
 def generate_output_filename(
@@ -265,18 +538,18 @@ def generate_output_filename(
     Format: YYYY.MM.DD.to.YYYY.MM.DD.Person1.Person2.mp4
     Single day: YYYY.MM.DD.Person1.mp4
     """
-    # Format dates as YYYY.MM.DD for sortability
-    start_str = start_date.strftime("%Y.%m.%d")
-    end_str = end_date.strftime("%Y.%m.%d")
-
-    # Check if same day (comparing just the date portion)
-    same_day = start_date.date() == end_date.date()
-
-    # Build date part
-    if same_day:
-        date_part = start_str
-    else:
-        date_part = f"{start_str}.to.{end_str}"
+    # Format dates as YYYY.MM.DD for sortability; integer f-strings skip
+    # strftime's per-call format parsing, and the end date is only
+    # formatted when the range actually spans days
+    date_part = f"{start_date.year:04d}.{start_date.month:02d}.{start_date.day:02d}"
+    # Tuple compare avoids allocating two date objects just to see whether
+    # the range spans more than one day
+    if (start_date.year, start_date.month, start_date.day) != (
+        end_date.year,
+        end_date.month,
+        end_date.day,
+    ):
+        date_part += f".to.{end_date.year:04d}.{end_date.month:02d}.{end_date.day:02d}"
 
     # Format people (replace spaces with dots, join with dots)
     if people:
@@ -287,17 +560,34 @@ def generate_output_filename(
     return f"{date_part}.{people_part}.mp4"
 
 
+# Compiled prompt validators - questionary runs these on every keystroke,
+# so cheap regex rejection avoids a strptime (and its exception) per key.
+_DATE_RE = re.compile(r"^\d{4}-\d{1,2}-\d{1,2}$")
+_NUM_RE = re.compile(r"^\d+(\.\d+)?$")
+
+
 def validate_date(date_str: str) -> bool:
     """Validate date string format."""
-    if not date_str:
+    if not date_str or not _DATE_RE.match(date_str):
         return False
     try:
-        datetime.strptime(date_str, "%Y-%m-%d")
+        # Only reached for date-shaped input: checks calendar validity.
+        # The zero-padded form takes the C-implemented ISO parser; strptime
+        # stays for the single-digit month/day leniency it has always had.
+        if len(date_str) == 10:
+            date.fromisoformat(date_str)
+        else:
+            datetime.strptime(date_str, "%Y-%m-%d")
         return True
     except ValueError:
         return False
 
 
+def validate_optional_number(num_str: str) -> bool:
+    """Validate an optional numeric prompt value (empty means no filter)."""
+    return not num_str or bool(_NUM_RE.match(num_str))
+
+
 def prompt_date_range() -> tuple[datetime, datetime]:
     """Prompt user for start and end dates."""
     console.print("\n[bold]Step 1: Select Date Range[/bold]")
@@ -326,33 +616,103 @@ def prompt_date_range() -> tuple[datetime, datetime]:
     return start_date, end_date
 
 
+# Future for a PhotosDB loaded in the background while the user answers
+# the date prompts; set by _start_photosdb_load() from main().
+_photosdb_future = None
+
+
+def _start_photosdb_load() -> None:
+    """Kick off the PhotosDB load on a background thread.
+
+    Loading the Photos library can take several seconds on large libraries;
+    starting it before the date prompts hides that latency behind the
+    user's keystrokes. query_videos() joins on the result.
+    """
+    global _photosdb_future
+    executor = ThreadPoolExecutor(max_workers=1)
+    _photosdb_future = executor.submit(osxphotos.PhotosDB)
+    executor.shutdown(wait=False)
+
+
 def query_videos(start_date: datetime, end_date: datetime) -> list:
     """Query videos from Photos library within date range."""
     console.print("\n[dim]Loading Photos library...[/dim]")
 
-    photosdb = osxphotos.PhotosDB()
+    if _photosdb_future is not None:
+        photosdb = _photosdb_future.result()
+    else:
+        photosdb = osxphotos.PhotosDB()
 
-    # Query all movies in date range
+    # Query all movies in date range; intrash=False filters trashed videos
+    # in osxphotos itself rather than materializing them only to drop them.
     photos = photosdb.photos(
-        movies=True, images=False, from_date=start_date, to_date=end_date
+        movies=True,
+        images=False,
+        from_date=start_date,
+        to_date=end_date,
+        intrash=False,
     )
 
-    # Filter to only include non-trashed videos
-    videos = [p for p in photos if not p.intrash]
+    # Sort once by date so downstream stages (which all preserve order)
+    # never re-sort.
+    videos = sorted(photos, key=_by_date)
 
     console.print(f"[green]Found {len(videos)} videos in date range[/green]")
     return videos
 
 
+# Memoized per-video person sets - attribute access into osxphotos
+# PhotoInfo objects is comparatively expensive, and several filter stages
+# touch the same videos.
+_persons_set_cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _persons_set(video: Any) -> frozenset[str]:
+    """Return a memoized frozenset of a video's persons."""
+    try:
+        return _persons_set_cache[video]
+    except KeyError:
+        pass
+    except TypeError:  # Unhashable or non-weakref-able object
+        return frozenset(video.persons)
+
+    persons = frozenset(video.persons)
+    _persons_set_cache[video] = persons
+    return persons
+
+
+# Memoized per-video durations - v.exif_info triggers a SQLite lookup and
+# parse per access, and the filter, summary, and playlist stages all need it.
+_duration_cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _video_duration(video: Any) -> float | None:
+    """Return a memoized duration for a video, or None if unknown."""
+    try:
+        return _duration_cache[video]
+    except KeyError:
+        pass
+    except TypeError:  # Unhashable or non-weakref-able object
+        return video.exif_info.duration if video.exif_info else None
+
+    duration = video.exif_info.duration if video.exif_info else None
+    _duration_cache[video] = duration
+    return duration
+
+
 def get_unique_persons(videos: list) -> list[str]:
     """Get unique named persons from video list."""
-    persons = set()
-    for v in videos:
-        for person in v.persons:
-            # Filter out unknown persons
-            if person and not person.startswith("_UNKNOWN"):
-                persons.add(person)
-    return sorted(persons)
+    if not videos:
+        return []
+
+    # First _persons_set call per video is a lazy Photos read; overlap
+    # them here so filter_by_people later runs on the warm memo
+    with ThreadPoolExecutor(max_workers=min(16, len(videos))) as executor:
+        person_sets = list(executor.map(_persons_set, videos))
+
+    all_persons = frozenset().union(*person_sets)
+    # Filter out unknown persons
+    return sorted(p for p in all_persons if p and not p.startswith("_UNKNOWN"))
 
 
 def prompt_people_selection(persons: list[str]) -> list[str] | None:
@@ -387,12 +747,9 @@ def filter_by_people(videos: list, selected_people: list[str] | None) -> list:
     if selected_people is None:
         return videos
 
-    filtered = []
-    for v in videos:
-        if any(person in v.persons for person in selected_people):
-            filtered.append(v)
-
-    return filtered
+    # Hashed set intersection instead of nested membership scans
+    selected = frozenset(selected_people)
+    return [v for v in videos if not selected.isdisjoint(_persons_set(v))]
 
 
 def prompt_quality_selection() -> EncodingSelection:
@@ -490,14 +847,18 @@ def prompt_duration_filter() -> tuple[float | None, float | None]:
     console.print("\n[bold]Step 3: Duration Filter[/bold]")
 
     min_str = questionary.text(
-        "Minimum duration in seconds (press Enter for no minimum):", default=""
+        "Minimum duration in seconds (press Enter for no minimum):",
+        default="",
+        validate=lambda x: validate_optional_number(x) or "Please enter a number",
     ).ask()
 
     if min_str is None:
         sys.exit(0)
 
     max_str = questionary.text(
-        "Maximum duration in seconds (press Enter for no maximum):", default=""
+        "Maximum duration in seconds (press Enter for no maximum):",
+        default="",
+        validate=lambda x: validate_optional_number(x) or "Please enter a number",
     ).ask()
 
     if max_str is None:
@@ -519,6 +880,21 @@ def prompt_duration_filter() -> tuple[float | None, float | None]:
     return min_dur, max_dur
 
 
+def _prefetch_durations(videos: list, workers: int = 16) -> None:
+    """Resolve every video's duration concurrently into the memo cache.
+
+    Each first read of v.exif_info is a lazy SQLite lookup; mapping them
+    across a thread pool overlaps the small reads so the duration filter,
+    summary table, and playlist assembly all hit the warm cache.
+    """
+    if not videos:
+        return
+    with ThreadPoolExecutor(max_workers=min(workers, len(videos))) as executor:
+        # Consume the iterator so worker exceptions surface here
+        for _ in executor.map(_video_duration, videos):
+            pass
+
+
 def filter_by_duration(
     videos: list, min_dur: float | None, max_dur: float | None
 ) -> list:
@@ -526,9 +902,10 @@ def filter_by_duration(
     if min_dur is None and max_dur is None:
         return videos
 
+    _prefetch_durations(videos)
     filtered = []
     for v in videos:
-        duration = v.exif_info.duration if v.exif_info else None
+        duration = _video_duration(v)
         if duration is None:
             continue
 
@@ -546,6 +923,9 @@ def display_video_summary(videos: list) -> None:
     """Display summary table of selected videos."""
     console.print("\n[bold]Step 4: Review Selection[/bold]\n")
 
+    # No-op when filter_by_duration already warmed the cache
+    _prefetch_durations(videos)
+
     table = Table(title="Selected Videos", show_lines=False)
     table.add_column("#", style="dim", width=4)
     table.add_column("Date", style="cyan", width=18)
@@ -555,12 +935,19 @@ def display_video_summary(videos: list) -> None:
     table.add_column("Size", style="magenta", width=10)
 
     total_size = 0
-    total_duration = 0
+    total_duration = 0.0
 
-    sorted_videos = sorted(videos, key=lambda x: x.date)
+    # query_videos returns videos already sorted by date and the filter
+    # stages preserve order, so no re-sort is needed per redraw.
+    sorted_videos = videos
+
+    # Prepare all row strings in one tight pass, then feed the table -
+    # rich's per-row rendering is pure Python and benefits from already-
+    # interpolated strings.
+    rows = []
 
     for i, v in enumerate(sorted_videos, 1):
-        duration = v.exif_info.duration if v.exif_info else 0
+        duration = _video_duration(v) or 0
         size = v.original_filesize or 0
 
         people = ", ".join(p for p in v.persons[:3] if not p.startswith("_UNKNOWN"))
@@ -573,18 +960,23 @@ def display_video_summary(videos: list) -> None:
             if len(location) > 28:
                 location = location[:25] + "..."
 
-        table.add_row(
-            str(i),
-            v.date.strftime("%Y-%m-%d %H:%M"),
-            format_duration(duration),
-            people or "-",
-            location or "-",
-            format_size(size),
+        rows.append(
+            (
+                str(i),
+                v.date.strftime(_DATE_FMT),
+                format_duration(duration),
+                people or "-",
+                location or "-",
+                format_size(size),
+            )
         )
 
         total_size += size
         total_duration += duration or 0
 
+    for row in rows:
+        table.add_row(*row)
+
     console.print(table)
 
     # Calculate estimated output duration (with transitions)
@@ -606,12 +998,25 @@ def display_video_summary(videos: list) -> None:
             f"\n[yellow]Note: {missing_count} videos are in iCloud and will be downloaded[/yellow]"
         )
 
+    # Note whether the selection qualifies for the stream-copy fast path
+    if _clips_are_uniform(videos):
+        console.print(
+            "\n[dim]Clips share codec/size/fps - eligible for stream-copy "
+            "concat with --no-transitions[/dim]"
+        )
+
 
 # =============================================================================
 # Interactive Video Selection (mpv subprocess)
 # =============================================================================
 
 
+@functools.lru_cache(maxsize=1)
+def _mpv_path() -> str | None:
+    """Locate the mpv binary once; which() walks PATH on every call."""
+    return shutil.which("mpv")
+
+
 def _check_mpv_available() -> bool:
     """
     Check if mpv binary is available for video playback.
@@ -619,7 +1024,7 @@ def _check_mpv_available() -> bool:
     Returns:
         True if mpv can be used, False otherwise.
     """
-    if shutil.which("mpv") is None:
+    if _mpv_path() is None:
         console.print("[yellow]mpv media player not installed[/yellow]")
         console.print("[dim]Install with: brew install mpv[/dim]")
         return False
@@ -629,21 +1034,102 @@ def _check_mpv_available() -> bool:
 # Path for mpv IPC socket
 MPV_SOCKET_PATH = "/tmp/montage-mpv-socket"
 
+# Persistent IPC connection for the current selection session. Keeping one
+# socket open avoids paying connect/send/close syscalls per keystroke.
+_mpv_sock: socket.socket | None = None
+
+
+def _connect_mpv_socket(timeout: float = 0.0) -> bool:
+    """Open the persistent IPC connection to mpv for this session.
+
+    With a timeout, polls every 10ms until mpv creates the socket - a
+    warm mpv is usually ready in ~30ms, so polling beats any fixed
+    startup sleep while staying robust on cold caches.
+    """
+    global _mpv_sock
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.connect(MPV_SOCKET_PATH)
+        except OSError:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+            continue
+        _mpv_sock = sock
+        return True
+
+
+def _close_mpv_socket() -> None:
+    """Close the persistent mpv IPC connection, if open."""
+    global _mpv_sock
+    if _mpv_sock is not None:
+        with contextlib.suppress(OSError):
+            _mpv_sock.close()
+        _mpv_sock = None
+
 
 def _send_mpv_command(command: list) -> bool:
     """
     Send a command to mpv via IPC socket.
 
+    Uses the persistent session socket when one is connected, reconnecting
+    once if mpv dropped the connection. Falls back to a one-shot socket
+    when no session is active.
+
     Args:
         command: List of command arguments (e.g., ["loadfile", "/path/to/video"])
 
     Returns:
         True if command was sent successfully, False otherwise.
     """
+    return _send_mpv_payload((json.dumps({"command": command}) + "\n").encode())
+
+
+# Pre-encoded template for the rotate command, the one IPC message sent
+# repeatedly with only a number changing - skips json.dumps per keypress.
+_ROTATE_TEMPLATE = b'{"command":["set_property","video-rotate","%d"]}\n'
+
+
+def _send_mpv_rotate(rotation: int) -> bool:
+    """Send a video-rotate property update via the pre-encoded template."""
+    return _send_mpv_payload(_ROTATE_TEMPLATE % rotation)
+
+
+def _send_mpv_commands(commands: list[list]) -> bool:
+    """Send several IPC commands to mpv in one socket write.
+
+    mpv accepts newline-delimited JSON, so batching commands that always
+    travel together (playlist advance + next-clip preload) halves the
+    syscalls per clip transition.
+    """
+    payload = b"".join(
+        (json.dumps({"command": command}) + "\n").encode() for command in commands
+    )
+    return _send_mpv_payload(payload)
+
+
+def _send_mpv_payload(payload: bytes) -> bool:
+    """Write an encoded IPC payload to mpv; shared by the senders above."""
+    if _mpv_sock is not None:
+        try:
+            _mpv_sock.sendall(payload)
+            return True
+        except OSError:
+            _close_mpv_socket()
+            if _connect_mpv_socket():
+                try:
+                    _mpv_sock.sendall(payload)
+                    return True
+                except OSError:
+                    _close_mpv_socket()
+            return False
+
     try:
         sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         sock.connect(MPV_SOCKET_PATH)
-        sock.send((json.dumps({"command": command}) + "\n").encode())
+        sock.send(payload)
         sock.close()
         return True
     except (ConnectionRefusedError, FileNotFoundError):
@@ -662,17 +1148,8 @@ def _display_video_metadata(
         total: Total number of videos
         state: Current selection state for kept/skipped counts
     """
-    # Clear previous output and show new metadata
-    console.print("\n" + "─" * 60)
-    console.print(
-        f"[bold cyan]Video {index + 1} of {total}[/bold cyan]"
-        f"                    [green]Kept: {state.kept_count}[/green] | "
-        f"[red]Skipped: {state.skipped_count}[/red]"
-    )
-    console.print("─" * 60)
-
     # Video metadata
-    duration = video.exif_info.duration if video.exif_info else 0
+    duration = _video_duration(video) or 0
     size = video.original_filesize or 0
 
     people = ", ".join(p for p in video.persons if not p.startswith("_UNKNOWN"))
@@ -685,26 +1162,54 @@ def _display_video_metadata(
     else:
         location = "-"
 
-    console.print(f"[dim]Date:[/dim]       {video.date.strftime('%Y-%m-%d %H:%M')}")
-    console.print(f"[dim]Duration:[/dim]   {format_duration(duration)}")
-    console.print(f"[dim]People:[/dim]     {people}")
-    console.print(f"[dim]Filename:[/dim]   {video.original_filename}")
-    console.print(f"[dim]Dimensions:[/dim] {video.width}x{video.height}")
-    console.print(f"[dim]Size:[/dim]       {format_size(size)}")
-    console.print(f"[dim]Location:[/dim]   {location}")
+    # Assemble the whole panel and print once - each console.print pays
+    # for a markup parse and a terminal write, and this renders per video
+    lines = [
+        "\n" + "─" * 60,
+        f"[bold cyan]Video {index + 1} of {total}[/bold cyan]"
+        f"                    [green]Kept: {state.kept_count}[/green] | "
+        f"[red]Skipped: {state.skipped_count}[/red]",
+        "─" * 60,
+        f"[dim]Date:[/dim]       {video.date.strftime(_DATE_FMT)}",
+        f"[dim]Duration:[/dim]   {format_duration(duration)}",
+        f"[dim]People:[/dim]     {people}",
+        f"[dim]Filename:[/dim]   {video.original_filename}",
+        f"[dim]Dimensions:[/dim] {video.width}x{video.height}",
+        f"[dim]Size:[/dim]       {format_size(size)}",
+        f"[dim]Location:[/dim]   {location}",
+    ]
 
     # Show rotation if non-zero
     if state.current_video.rotation != 0:
-        console.print(f"[cyan]Rotation:[/cyan]   {state.current_video.rotation}°")
+        lines.append(f"[cyan]Rotation:[/cyan]   {state.current_video.rotation}°")
 
-    console.print("─" * 60)
-    console.print(
+    lines.append("─" * 60)
+    lines.append(
         "[bold]→/Enter:[/bold] Keep   "
         "[bold]←/Backspace:[/bold] Skip   "
         "[bold]R:[/bold] Rotate   "
         "[bold]U:[/bold] Undo   "
         "[bold]Q:[/bold] Quit"
     )
+    console.print("\n".join(lines))
+
+
+def _warm_video_metadata(video: Any) -> None:
+    """
+    Touch the lazy properties _display_video_metadata reads.
+
+    Runs on a background thread while the user watches the current clip,
+    so the next panel renders from warm caches (Photos database reads,
+    formatter memoization) instead of paying for them at keypress time.
+    """
+    try:
+        format_duration(_video_duration(video) or 0)
+        format_size(video.original_filesize or 0)
+        _ = video.persons, video.original_filename, video.width, video.height
+        if video.place:
+            _ = video.place.name
+    except Exception:
+        pass  # Best-effort warmup; display falls back to a cold read
 
 
 def _display_selection_summary(state: SelectionState) -> None:
@@ -736,6 +1241,82 @@ def _display_selection_summary(state: SelectionState) -> None:
     console.print("═" * 60 + "\n")
 
 
+# Keystroke -> decision action for the selection loop. Arrow keys arrive
+# as three-byte escape sequences (ESC [ C / ESC [ D).
+_DECISION_KEYS = {
+    "1": "keep",
+    "\r": "keep",
+    "\n": "keep",
+    "\x1b[C": "keep",
+    "2": "skip",
+    "\x7f": "skip",
+    "\x1b[D": "skip",
+    "r": "rotate",
+    "R": "rotate",
+    "u": "undo",
+    "U": "undo",
+    "q": "quit",
+    "Q": "quit",
+}
+
+
+def _read_decision_key() -> str:
+    """
+    Read a single decision keystroke in cbreak mode.
+
+    Avoids spinning up a full questionary/prompt-toolkit application for
+    every video - the loop only needs one keypress. Returns "keep",
+    "skip", "rotate", "undo", or "quit"; unmapped keys are ignored.
+    """
+    fd = sys.stdin.fileno()
+    old_attrs = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)
+        while True:
+            # os.read bypasses Python's stdin buffering - an arrow key's
+            # escape sequence must stay on the descriptor so select() below
+            # can see the continuation bytes.
+            data = os.read(fd, 1)
+            if not data:
+                # EOF/hangup: no more keys are coming, end the session
+                return "quit"
+            key = data.decode(errors="replace")
+            if key == "\x1b":
+                # Arrow keys arrive as a 3-byte sequence; a bare Escape has
+                # no follow-up bytes, so only read ones already pending
+                while len(key) < 3 and select.select([fd], [], [], 0.05)[0]:
+                    key += os.read(fd, 1).decode(errors="replace")
+            action = _DECISION_KEYS.get(key)
+            if action:
+                return action
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_attrs)
+
+
+def _prompt_decision() -> str | None:
+    """
+    Ask for the next keep/skip decision, preferring raw keypress input.
+
+    Falls back to a questionary menu when stdin is not a real terminal
+    (e.g. tests or piped input).
+    """
+    try:
+        return _read_decision_key()
+    except (termios.error, ValueError, OSError):
+        return questionary.select(
+            "Decision:",
+            choices=[
+                questionary.Choice("Keep", value="keep", shortcut_key="1"),
+                questionary.Choice("Skip", value="skip", shortcut_key="2"),
+                questionary.Choice("Rotate 90°", value="rotate", shortcut_key="r"),
+                questionary.Choice("Undo", value="undo", shortcut_key="3"),
+                questionary.Choice("Quit", value="quit", shortcut_key="4"),
+            ],
+            use_shortcuts=True,
+            use_jk_keys=False,
+        ).ask()
+
+
 def interactive_video_selection(videos: list) -> tuple[list, dict[str, int]]:
     """
     Present videos for interactive keep/skip selection using mpv playback.
@@ -775,8 +1356,8 @@ def interactive_video_selection(videos: list) -> tuple[list, dict[str, int]]:
         console.print("[yellow]No local videos available for preview.[/yellow]")
         return videos, {}
 
-    # Sort by date for chronological review
-    playable_videos = sorted(playable_videos, key=lambda x: x.date)
+    # query_videos returns date-sorted videos and the split above preserves
+    # order, so the list is already chronological for review.
 
     # Initialize state
     state = SelectionState(decisions=[VideoDecision(video=v) for v in playable_videos])
@@ -788,6 +1369,7 @@ def interactive_video_selection(videos: list) -> tuple[list, dict[str, int]]:
     )
 
     mpv_process = None
+    metadata_pool = ThreadPoolExecutor(max_workers=1)
 
     # Clean up any stale socket file
     if os.path.exists(MPV_SOCKET_PATH):
@@ -812,77 +1394,104 @@ def interactive_video_selection(videos: list) -> tuple[list, dict[str, int]]:
             stderr=subprocess.DEVNULL,
         )
 
-        # Brief wait for mpv to create the socket
-        time.sleep(0.3)
+        # Poll until mpv creates the socket, then hold one connection
+        # open for the whole session
+        _connect_mpv_socket(timeout=5.0)
+
+        # Preload the next clip into mpv's playlist so Keep/Skip can
+        # advance with playlist-next instead of a cold loadfile, which
+        # stalls for however long mpv takes to open the file.
+        preloaded_index: int | None = None
+
+        def show_video(index: int) -> None:
+            """Jump playback to `index`, preloading the clip after it."""
+            nonlocal preloaded_index
+            commands = []
+            if preloaded_index == index:
+                commands.append(["playlist-next", "force"])
+            else:
+                # Out-of-order jump (undo): replace clears the playlist
+                commands.append(
+                    ["loadfile", str(state.decisions[index].video.path), "replace"]
+                )
+            if index + 1 < state.total_count:
+                commands.append(
+                    ["loadfile", str(state.decisions[index + 1].video.path), "append"]
+                )
+                preloaded_index = index + 1
+            else:
+                preloaded_index = None
+            _send_mpv_commands(commands)
+
+        if state.total_count > 1:
+            _send_mpv_command(
+                ["loadfile", str(state.decisions[1].video.path), "append"]
+            )
+            preloaded_index = 1
 
         while not state.should_quit and state.current_index < state.total_count:
             current = state.current_video
 
+            # Warm the next video's metadata while the user watches this one
+            if state.current_index + 1 < state.total_count:
+                metadata_pool.submit(
+                    _warm_video_metadata,
+                    state.decisions[state.current_index + 1].video,
+                )
+
             # Display metadata in terminal
             _display_video_metadata(
                 current.video, state.current_index, state.total_count, state
             )
 
-            # Get user choice via questionary
-            choice = questionary.select(
-                "Decision:",
-                choices=[
-                    questionary.Choice("Keep", shortcut_key="1"),
-                    questionary.Choice("Skip", shortcut_key="2"),
-                    questionary.Choice("Rotate 90°", shortcut_key="r"),
-                    questionary.Choice("Undo", shortcut_key="3"),
-                    questionary.Choice("Quit", shortcut_key="4"),
-                ],
-                use_shortcuts=True,
-                use_jk_keys=False,
-            ).ask()
+            console.print(
+                "[dim][1/enter/→] keep  [2/del/←] skip  [r] rotate  "
+                "[u] undo  [q] quit[/dim]"
+            )
+
+            # Get user choice from a single keystroke
+            choice = _prompt_decision()
 
             # Process choice
-            if choice == "Rotate 90°":
+            if choice == "rotate":
                 current.rotation = (current.rotation + 90) % 360
-                _send_mpv_command(
-                    ["set_property", "video-rotate", str(current.rotation)]
-                )
+                _send_mpv_rotate(current.rotation)
                 console.print(f"[cyan]↻ Rotated to {current.rotation}°[/cyan]")
                 continue  # Stay on same video
-            elif choice == "Keep":
-                current.decision = "keep"
+            elif choice == "keep":
+                state.set_decision(state.current_index, "keep")
                 console.print("[green]✓ KEPT[/green]")
                 if state.has_next():
                     state.current_index += 1
-                    # Load next video via IPC
-                    next_path = str(state.decisions[state.current_index].video.path)
-                    _send_mpv_command(["loadfile", next_path])
+                    show_video(state.current_index)
                 else:
                     break
-            elif choice == "Skip":
-                current.decision = "skip"
+            elif choice == "skip":
+                state.set_decision(state.current_index, "skip")
                 console.print("[red]✗ SKIPPED[/red]")
                 if state.has_next():
                     state.current_index += 1
-                    # Load next video via IPC
-                    next_path = str(state.decisions[state.current_index].video.path)
-                    _send_mpv_command(["loadfile", next_path])
+                    show_video(state.current_index)
                 else:
                     break
-            elif choice == "Undo":
+            elif choice == "undo":
                 if state.has_previous():
-                    state.decisions[state.current_index].decision = "pending"
+                    state.set_decision(state.current_index, "pending")
                     state.current_index -= 1
-                    state.current_video.decision = "pending"
+                    state.set_decision(state.current_index, "pending")
                     console.print("[yellow]↩ UNDO[/yellow]")
-                    # Load previous video via IPC
-                    prev_path = str(state.decisions[state.current_index].video.path)
-                    _send_mpv_command(["loadfile", prev_path])
+                    show_video(state.current_index)
                 else:
                     console.print("[dim]Nothing to undo[/dim]")
-            elif choice == "Quit" or choice is None:
+            elif choice == "quit" or choice is None:
                 state.should_quit = True
 
     except KeyboardInterrupt:
         state.should_quit = True
         console.print("\n[yellow]Selection interrupted[/yellow]")
     finally:
+        metadata_pool.shutdown(wait=False)
+        _close_mpv_socket()
         if mpv_process:
             mpv_process.terminate()
             mpv_process.wait()
@@ -920,14 +1529,41 @@ def interactive_video_selection(videos: list) -> tuple[list, dict[str, int]]:
     return kept, rotation_map
 
 
-def export_videos(videos: list) -> dict[str, Path]:
-    """Export videos to local cache, skip if already exists."""
+def _prefetch_missing(videos: list, workers: int = 8) -> None:
+    """Concurrently download iCloud-only videos into the export cache.
+
+    osxphotos exports of missing assets are dominated by network latency,
+    so a small worker pool overlaps the downloads instead of paying for
+    each one serially inside export_videos. Fetched files land in
+    VIDEOS_DIR under their UUID name, so the export step treats them as
+    cache hits.
+    """
+    missing = [v for v in videos if v.ismissing]
+    if not missing:
+        return
+
     VIDEOS_DIR.mkdir(exist_ok=True)
+    console.print(f"\n[bold]Prefetching {len(missing)} iCloud videos[/bold]\n")
 
-    exported = {}
-    sorted_videos = sorted(videos, key=lambda x: x.date)
+    # One scandir pass replaces a stat() per video for cache-hit checks
+    cached_names = {e.name for e in os.scandir(VIDEOS_DIR)}
 
-    console.print("\n[bold]Step 5: Exporting Videos[/bold]\n")
+    def fetch(v: Any) -> tuple[Any, bool]:
+        dest_path = VIDEOS_DIR / f"{v.uuid}.mov"
+        if dest_path.name in cached_names:
+            return v, True
+        try:
+            results = v.export(
+                str(VIDEOS_DIR),
+                use_photos_export=True,
+                timeout=300,  # 5 minute timeout for large files
+            )
+        except Exception:
+            return v, False
+        if not results:
+            return v, False
+        os.replace(results[0], dest_path)
+        return v, True
 
     with Progress(
         SpinnerColumn(),
@@ -935,44 +1571,93 @@ def export_videos(videos: list) -> dict[str, Path]:
         BarColumn(),
         TaskProgressColumn(),
         TimeElapsedColumn(),
-        TimeRemainingColumn(),
         console=console,
     ) as progress:
-        task = progress.add_task("Exporting...", total=len(sorted_videos))
+        task = progress.add_task("Prefetching...", total=len(missing))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(fetch, v) for v in missing]
+            for future in as_completed(futures):
+                v, ok = future.result()
+                if not ok:
+                    console.print(
+                        f"[red]Failed to prefetch: {v.original_filename}[/red]"
+                    )
+                progress.update(task, advance=1)
 
-        for v in sorted_videos:
-            dest_path = VIDEOS_DIR / f"{v.uuid}.mov"
 
-            if dest_path.exists():
-                progress.update(
-                    task,
-                    advance=1,
-                    description=f"[dim]Cached: {v.original_filename}[/dim]",
-                )
-                exported[v.uuid] = dest_path
-                continue
+def export_videos(videos: list) -> dict[str, Path]:
+    """Export videos to local cache, skip if already exists.
 
-            progress.update(task, description=f"Exporting: {v.original_filename}")
+    Exports run on a small thread pool - v.export() is I/O-bound (Photos
+    library disk copy or iCloud download), so a single stalled download no
+    longer holds up the rest of the batch.
+    """
+    VIDEOS_DIR.mkdir(exist_ok=True)
 
-            try:
-                # Use osxphotos export - this handles iCloud download
-                results = v.export(
-                    str(VIDEOS_DIR),
-                    use_photos_export=True,
-                    timeout=300,  # 5 minute timeout for large files
-                )
+    exported: dict[str, Path] = {}
+
+    console.print("\n[bold]Step 5: Exporting Videos[/bold]\n")
+
+    # One scandir pass replaces a stat() per video for cache-hit checks
+    cached_names = {e.name for e in os.scandir(VIDEOS_DIR)}
+
+    def _export_one(v: Any) -> tuple[Any, Path | None, str | None]:
+        """Export a single video; returns (video, dest or None, error)."""
+        dest_path = VIDEOS_DIR / f"{v.uuid}.mov"
+
+        if dest_path.name in cached_names:
+            return v, dest_path, None
+
+        try:
+            # Use osxphotos export - this handles iCloud download
+            results = v.export(
+                str(VIDEOS_DIR),
+                use_photos_export=True,
+                timeout=300,  # 5 minute timeout for large files
+            )
+        except Exception as e:
+            return v, None, str(e)
+
+        if not results:
+            return v, None, None
+
+        # Rename to UUID-based name (os.replace: atomic, single syscall)
+        os.replace(results[0], dest_path)
+        return v, dest_path, None
 
-                if results:
-                    # Rename to UUID-based name
-                    exported_path = Path(results[0])
-                    exported_path.rename(dest_path)
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+        TimeElapsedColumn(),
+        TimeRemainingColumn(),
+        console=console,
+    ) as progress:
+        task = progress.add_task("Exporting...", total=len(videos))
+
+        # Rich's Progress is thread-safe, so completions can advance the
+        # bar directly from as_completed order.
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(_export_one, v) for v in videos]
+            for future in as_completed(futures):
+                v, dest_path, error = future.result()
+                if dest_path is not None:
                     exported[v.uuid] = dest_path
+                    progress.update(
+                        task,
+                        advance=1,
+                        description=f"Exported: {v.original_filename}",
+                    )
+                    continue
+                if error is not None:
+                    console.print(
+                        f"[red]Error exporting {v.original_filename}: {error}[/red]"
+                    )
                 else:
                     console.print(f"[red]Failed to export: {v.original_filename}[/red]")
-            except Exception as e:
-                console.print(f"[red]Error exporting {v.original_filename}: {e}[/red]")
-
-            progress.update(task, advance=1)
+                progress.update(task, advance=1)
 
     console.print(f"\n[green]Exported {len(exported)} videos to {VIDEOS_DIR}[/green]")
     return exported
@@ -989,7 +1674,7 @@ def create_playlist(
     projects_dir = PROJECTS_DIR / project_name
     projects_dir.mkdir(parents=True, exist_ok=True)
 
-    sorted_videos = sorted(videos, key=lambda x: x.date)
+    sorted_videos = sorted(videos, key=_by_date)
     rotation_map = rotation_map or {}
 
     videos_list: list[dict] = []
@@ -1000,35 +1685,91 @@ def create_playlist(
         "videos": videos_list,
     }
 
-    for v in sorted_videos:
-        if v.uuid not in exported:
-            continue
+    def _entry_meta(v: Any) -> tuple:
+        """Snapshot every lazily-loaded attribute a playlist entry needs."""
+        return (
+            _video_duration(v) or 0,
+            v.width,
+            v.height,
+            getattr(v.exif_info, "codec", None),
+            getattr(v.exif_info, "fps", None),
+            v.original_filename,
+            list(v.persons),
+        )
+
+    # Attribute access into PhotoInfo can trigger lazy database reads;
+    # snapshot everything concurrently so the assembly loop below touches
+    # only plain Python values, never the Photos SQLite.
+    included = [v for v in sorted_videos if v.uuid in exported]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        uuids = [v.uuid for v in included]
+        meta = dict(zip(uuids, executor.map(_entry_meta, included), strict=True))
 
-        duration = v.exif_info.duration if v.exif_info else 0
-        is_portrait = v.height > v.width if v.height and v.width else False
+    for v in included:
+        duration, width, height, codec, fps, filename, persons = meta[v.uuid]
+        is_portrait = height > width if height and width else False
 
         videos_list.append(
             {
                 "uuid": v.uuid,
                 "date": v.date.isoformat(),
                 "duration": duration,
-                "filename": v.original_filename,
-                "persons": v.persons,
+                "filename": filename,
+                "persons": persons,
                 "is_portrait": is_portrait,
-                "width": v.width,
-                "height": v.height,
+                "width": width,
+                "height": height,
+                # codec/fps feed the stream-copy uniformity check at compile time
+                "codec": codec,
+                "fps": fps,
                 "path": str(exported[v.uuid].absolute()),
                 "rotation": rotation_map.get(v.uuid, 0),
             }
         )
 
     playlist_path = projects_dir / "playlist.json"
-    playlist_path.write_text(json.dumps(playlist, indent=2))
+    # Stream straight to the file - json.dumps would build the whole
+    # document in memory first. indent=2 stays: playlist.json is meant to
+    # be human-inspectable.
+    with playlist_path.open("w") as f:
+        json.dump(playlist, f, indent=2)
 
     console.print(f"\n[green]Created playlist: {playlist_path}[/green]")
     return playlist_path
 
 
+# Rotation filter fragments keyed by degrees. 180 uses hflip,vflip, which
+# ffmpeg evaluates without the pixel transposes a double transpose costs.
+_ROTATE_PART = {
+    0: "",
+    90: "transpose=1,",
+    180: "hflip,vflip,",
+    270: "transpose=2,",
+}
+
+
+# Filter-graph templates, rendered once at import with the TARGET_* constants
+# baked in; call time is a single .format over the input index and rotation.
+# Pyramid blur: downscale 8x, blur the small image, upscale back. Same visual
+# result as gblur=sigma=50 on full frames at ~1/64 the blurred pixels - the
+# blur is the most expensive node in the graph.
+_PORTRAIT_TEMPLATE = (
+    f"[{{i}}:v]{{rot}}split[{{i}}orig][{{i}}copy];"
+    f"[{{i}}copy]scale={TARGET_WIDTH}:{TARGET_HEIGHT}:force_original_aspect_ratio=increase,"
+    f"crop={TARGET_WIDTH}:{TARGET_HEIGHT},"
+    f"scale=iw/8:ih/8,gblur=sigma=6,"
+    f"scale={TARGET_WIDTH}:{TARGET_HEIGHT}[{{i}}blur];"
+    f"[{{i}}blur][{{i}}orig]overlay=(W-w)/2:(H-h)/2,"
+    f"setsar=1,fps={TARGET_FPS},settb=AVTB[v{{i}}]"
+)
+
+_LANDSCAPE_TEMPLATE = (
+    f"[{{i}}:v]{{rot}}scale={TARGET_WIDTH}:{TARGET_HEIGHT}:force_original_aspect_ratio=decrease,"
+    f"pad={TARGET_WIDTH}:{TARGET_HEIGHT}:(ow-iw)/2:(oh-ih)/2:black,"
+    f"setsar=1,fps={TARGET_FPS},settb=AVTB[v{{i}}]"
+)
+
+
 def build_portrait_filter(input_idx: int, rotation: int = 0) -> str:
     """Build ffmpeg filter for portrait video with blurred pillarbox.
 
@@ -1036,22 +1777,7 @@ def build_portrait_filter(input_idx: int, rotation: int = 0) -> str:
         input_idx: Index of the input video stream
         rotation: Rotation in degrees (0, 90, 180, 270)
     """
-    # Build rotation filter if needed
-    rotate_part = ""
-    if rotation == 90:
-        rotate_part = "transpose=1,"
-    elif rotation == 180:
-        rotate_part = "transpose=1,transpose=1,"
-    elif rotation == 270:
-        rotate_part = "transpose=2,"
-
-    return (
-        f"[{input_idx}:v]{rotate_part}split[{input_idx}orig][{input_idx}copy];"
-        f"[{input_idx}copy]scale={TARGET_WIDTH}:{TARGET_HEIGHT}:force_original_aspect_ratio=increase,"
-        f"crop={TARGET_WIDTH}:{TARGET_HEIGHT},gblur=sigma=50[{input_idx}blur];"
-        f"[{input_idx}blur][{input_idx}orig]overlay=(W-w)/2:(H-h)/2,"
-        f"setsar=1,fps={TARGET_FPS},settb=AVTB[v{input_idx}]"
-    )
+    return _PORTRAIT_TEMPLATE.format(i=input_idx, rot=_ROTATE_PART[rotation])
 
 
 def build_landscape_filter(input_idx: int, rotation: int = 0) -> str:
@@ -1061,26 +1787,347 @@ def build_landscape_filter(input_idx: int, rotation: int = 0) -> str:
         input_idx: Index of the input video stream
         rotation: Rotation in degrees (0, 90, 180, 270)
     """
-    # Build rotation filter if needed
-    rotate_part = ""
-    if rotation == 90:
-        rotate_part = "transpose=1,"
-    elif rotation == 180:
-        rotate_part = "transpose=1,transpose=1,"
-    elif rotation == 270:
-        rotate_part = "transpose=2,"
+    return _LANDSCAPE_TEMPLATE.format(i=input_idx, rot=_ROTATE_PART[rotation])
+
 
+def _probe_clip_signature(path: str) -> dict | None:
+    """Probe codec/size/fps for a clip via ffprobe.
+
+    Fallback for playlist entries written before codec/fps metadata was
+    recorded. Returns a dict of playlist fields, or None on any failure.
+    """
+    try:
+        proc = subprocess.run(
+            [
+                "ffprobe",
+                "-v",
+                "error",
+                "-select_streams",
+                "v:0",
+                "-show_entries",
+                "stream=codec_name,width,height,r_frame_rate",
+                "-of",
+                "json",
+                path,
+            ],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+        stream = json.loads(proc.stdout)["streams"][0]
+        num, _, den = stream["r_frame_rate"].partition("/")
+        return {
+            "codec": stream["codec_name"],
+            "width": stream["width"],
+            "height": stream["height"],
+            "fps": round(int(num) / int(den or 1)),
+        }
+    except Exception:
+        return None
+
+
+def _fill_missing_signatures(playlist: dict, playlist_path: Path) -> None:
+    """Backfill codec/fps for playlist entries missing that metadata.
+
+    Older playlists predate the codec/fps fields and would never pass the
+    uniformity check. Probe those clips concurrently with ffprobe and cache
+    the results back into playlist.json so each file is probed only once.
+    """
+    missing = [
+        v for v in playlist["videos"] if v.get("codec") is None or v.get("fps") is None
+    ]
+    if not missing:
+        return
+
+    updated = False
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {
+            executor.submit(_probe_clip_signature, v["path"]): v for v in missing
+        }
+        for future, v in futures.items():
+            meta = future.result()
+            if meta is not None:
+                v.update(meta)
+                updated = True
+
+    if updated:
+        try:
+            with playlist_path.open("w") as f:
+                json.dump(playlist, f, indent=2)
+        except OSError:
+            pass  # Cache write is best-effort; the in-memory data is used
+
+
+def _concat_stream_copy(videos: list[dict], output_path: Path) -> Path | None:
+    """Concatenate uniform clips without re-encoding via the concat demuxer.
+
+    Mux-only work - no decode or encode - so this is orders of magnitude
+    faster than the filter-graph pipeline. Only valid when clips share
+    codec, dimensions, and frame rate (see _clips_are_uniform).
+    """
+    list_path = output_path.parent / "concat_list.txt"
+
+    # concat demuxer quoting: single quotes in paths become '\''
+    lines = []
+    for v in videos:
+        escaped = v["path"].replace("'", "'\\''")
+        lines.append(f"file '{escaped}'")
+    list_path.write_text("\n".join(lines) + "\n")
+
+    cmd = [
+        "ffmpeg",
+        "-y",
+        "-f",
+        "concat",
+        "-safe",
+        "0",
+        "-i",
+        str(list_path),
+        "-c",
+        "copy",
+        "-movflags",
+        "+faststart",
+        str(output_path),
+    ]
+
+    console.print("[dim]Running ffmpeg (stream copy, no re-encode)...[/dim]")
+    console.print(f"[dim]Output: {output_path}[/dim]")
+
+    try:
+        subprocess.run(cmd, capture_output=True, check=True)
+    except FileNotFoundError:
+        console.print(
+            "[red]ffmpeg not found. Please install with: brew install ffmpeg[/red]"
+        )
+        return None
+    except subprocess.CalledProcessError as e:
+        console.print(f"\n[red]ffmpeg failed with return code {e.returncode}[/red]")
+        return None
+    finally:
+        list_path.unlink(missing_ok=True)
+
+    console.print(
+        f"\n[bold green]Movie created successfully: {output_path}[/bold green]"
+    )
+
+    if output_path.exists():
+        size = output_path.stat().st_size
+        console.print(f"[dim]Output size: {format_size(size)}[/dim]")
+
+    return output_path
+
+
+def _xfade_filter_parts(videos: list[dict], vin_fmt: str, ain_fmt: str) -> list[str]:
+    """Build the xfade/acrossfade chain joining normalized inputs.
+
+    Fade offsets come from one accumulate pass - the i-th fade starts at
+    the summed duration of the first i+1 clips minus the i+1 transition
+    overlaps - instead of threading a cumulative variable through the
+    loop. vin_fmt/ain_fmt name the first-use input labels (the single
+    pass uses [v{i}], the segmented join reads [{i}:v] directly).
+    """
+    offsets = [
+        total - (i + 1) * TRANSITION_DURATION
+        for i, total in enumerate(
+            itertools.accumulate(v["duration"] for v in videos[:-1])
+        )
+    ]
+
+    parts = []
+    last = len(videos) - 2
+    for i, offset in enumerate(offsets):
+        v_in1 = vin_fmt.format(i=i) if i == 0 else f"[vt{i - 1}]"
+        a_in1 = ain_fmt.format(i=i) if i == 0 else f"[at{i - 1}]"
+        if i == last:
+            v_out, a_out = "[vout]", "[aout]"
+        else:
+            v_out, a_out = f"[vt{i}]", f"[at{i}]"
+
+        parts.append(
+            f"{v_in1}{vin_fmt.format(i=i + 1)}"
+            f"xfade=transition=fade:duration={TRANSITION_DURATION}:offset={offset:.3f}{v_out}"
+        )
+        parts.append(
+            f"{a_in1}{ain_fmt.format(i=i + 1)}"
+            f"acrossfade=d={TRANSITION_DURATION}:c1=tri:c2=tri{a_out}"
+        )
+    return parts
+
+
+def _matches_target(v: dict) -> bool:
+    """True when a clip already has the target geometry and frame rate.
+
+    Such clips can skip the scale/pad nodes entirely - only the timing
+    metadata (SAR, timebase) needs normalizing for xfade to accept them.
+    """
+    fps = v.get("fps")
     return (
-        f"[{input_idx}:v]{rotate_part}scale={TARGET_WIDTH}:{TARGET_HEIGHT}:force_original_aspect_ratio=decrease,"
-        f"pad={TARGET_WIDTH}:{TARGET_HEIGHT}:(ow-iw)/2:(oh-ih)/2:black,"
-        f"setsar=1,fps={TARGET_FPS},settb=AVTB[v{input_idx}]"
+        v.get("width") == TARGET_WIDTH
+        and v.get("height") == TARGET_HEIGHT
+        and fps is not None
+        and abs(fps - TARGET_FPS) < 0.01
+    )
+
+
+def _passthrough_filter(input_idx: int) -> str:
+    """Metadata-only normalize for clips that already match the target."""
+    return f"[{input_idx}:v]setsar=1,settb=AVTB[v{input_idx}]"
+
+
+def _compile_segmented(
+    videos: list[dict],
+    output_path: Path,
+    encoder: str,
+    enc_settings: dict,
+    quality_tier: str,
+    input_args: list[str],
+    total_duration: float,
+) -> Path | None:
+    """Two-stage compile: parallel per-clip normalization, then xfade join.
+
+    The single filter_complex path decodes and normalizes every input in
+    one ffmpeg process. Here each clip is first rendered to a normalized
+    intermediate on its own process (clip-local scale/blur/fps work
+    parallelizes cleanly), then one final pass applies only the crossfades
+    between the uniform intermediates. Peak memory stays flat in clip
+    count and the GPU encoder is kept saturated per segment.
+    """
+    segments_dir = output_path.parent / "segments"
+    segments_dir.mkdir(exist_ok=True)
+
+    def encode_segment(i: int, v: dict) -> tuple[int, Path | None]:
+        seg_path = segments_dir / f"{i:04d}.mov"
+        rotation = v.get("rotation", 0)
+        if v["is_portrait"]:
+            vfilter = build_portrait_filter(0, rotation)
+        elif rotation == 0 and _matches_target(v):
+            vfilter = _passthrough_filter(0)
+        else:
+            vfilter = build_landscape_filter(0, rotation)
+        afilter = (
+            "[0:a]aresample=48000,aformat=sample_fmts=fltp:channel_layouts=stereo[a0]"
+        )
+
+        cmd = [
+            "ffmpeg",
+            "-y",
+            *input_args,
+            "-i",
+            v["path"],
+            "-filter_complex",
+            f"{vfilter};{afilter}",
+            "-map",
+            "[v0]",
+            "-map",
+            "[a0]",
+            "-c:v",
+            encoder,
+            "-pix_fmt",
+            enc_settings["pix_fmt"],
+            enc_settings["quality_flag"],
+            enc_settings["quality_values"][quality_tier],
+            *enc_settings.get("extra_args", []),
+            "-c:a",
+            "aac",
+            "-b:a",
+            "192k",
+            str(seg_path),
+        ]
+
+        try:
+            proc = subprocess.run(
+                cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
+        except FileNotFoundError:
+            return i, None
+        return i, seg_path if proc.returncode == 0 else None
+
+    workers = min(len(videos), os.cpu_count() or 2)
+    segments: list[Path | None] = [None] * len(videos)
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+        TimeElapsedColumn(),
+        console=console,
+    ) as progress:
+        task = progress.add_task("Normalizing clips...", total=len(videos))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(encode_segment, i, v) for i, v in enumerate(videos)
+            ]
+            for future in as_completed(futures):
+                i, seg = future.result()
+                segments[i] = seg
+                progress.update(task, advance=1)
+
+    if any(s is None for s in segments):
+        console.print("[red]Segment encoding failed[/red]")
+        shutil.rmtree(segments_dir, ignore_errors=True)
+        return None
+
+    # Final pass: the intermediates are uniform, so the graph is just one
+    # xfade/acrossfade per boundary - no per-clip normalize nodes.
+    inputs: list[str] = []
+    for seg in segments:
+        inputs.extend(["-i", str(seg)])
+
+    filter_parts = _xfade_filter_parts(videos, "[{i}:v]", "[{i}:a]")
+
+    cmd = ["ffmpeg", "-y"]
+    cmd.extend(inputs)
+    cmd.extend(
+        [
+            "-filter_complex",
+            ";".join(filter_parts),
+            "-map",
+            "[vout]",
+            "-map",
+            "[aout]",
+            "-c:v",
+            encoder,
+            "-pix_fmt",
+            enc_settings["pix_fmt"],
+            enc_settings["quality_flag"],
+            enc_settings["quality_values"][quality_tier],
+            *enc_settings.get("extra_args", []),
+            "-tag:v",
+            "hvc1",
+            "-c:a",
+            "aac",
+            "-b:a",
+            "192k",
+            "-movflags",
+            "+faststart",
+            str(output_path),
+        ]
     )
 
+    console.print("[dim]Joining segments...[/dim]")
+    result = _run_ffmpeg_with_progress(cmd, total_duration, output_path)
+    shutil.rmtree(segments_dir, ignore_errors=True)
+    return result
+
 
 def compile_movie(
-    playlist_path: Path, encoding: EncodingSelection | None = None
+    playlist_path: Path,
+    encoding: EncodingSelection | None = None,
+    use_transitions: bool = True,
+    segmented: bool = False,
+    renditions: list[str] | None = None,
 ) -> Path | None:
-    """Compile videos into a single movie using ffmpeg."""
+    """Compile videos into a single movie using ffmpeg.
+
+    With use_transitions=False, uniform clip sets (same codec, dimensions,
+    and fps) are concatenated with stream copy instead of re-encoding.
+    With segmented=True, clips are normalized in parallel to intermediates
+    and only the crossfades run in the final pass.
+    renditions lists extra quality tiers to emit in the same pass; the
+    decode and filter graph run once and feed every output.
+    """
     console.print("\n[bold]Step 7: Compiling Movie[/bold]\n")
 
     # Determine encoder settings
@@ -1150,17 +2197,65 @@ def compile_movie(
     output_filename = generate_output_filename(start_date, end_date, people)
     output_path = project_dir / output_filename
 
+    # A single clip already in target format has nothing to transition or
+    # normalize - remux it instead of re-encoding. Relies on the fps/codec
+    # fields create_playlist records; entries without them fall through.
+    if (
+        len(videos) == 1
+        and not videos[0]["is_portrait"]
+        and videos[0].get("rotation", 0) == 0
+        and _matches_target(videos[0])
+    ):
+        console.print(
+            "[green]Single clip already matches target format - "
+            "using stream copy[/green]"
+        )
+        return _concat_stream_copy(videos, output_path)
+
+    # Transitions disabled: try the mux-only fast path for uniform clips
+    if not use_transitions:
+        _fill_missing_signatures(playlist, playlist_path)
+        if _clips_are_uniform(videos):
+            console.print(
+                "[green]Clips share codec/size/fps - using stream copy[/green]"
+            )
+            return _concat_stream_copy(videos, output_path)
+        console.print(
+            "[yellow]Clips differ in codec/size/fps - stream copy unavailable, "
+            "re-encoding with transitions[/yellow]"
+        )
+
+    # Hardware decode flags - only when the local ffmpeg supports videotoolbox
+    input_args = enc_settings.get("input_args", [])
+    if input_args and "videotoolbox" not in _list_ffmpeg_hwaccels():
+        input_args = []
+
+    # Segmented mode: normalize clips in parallel, then join with xfades
+    if segmented and len(videos) > 1:
+        return _compile_segmented(
+            videos,
+            output_path,
+            encoder,
+            enc_settings,
+            quality_tier,
+            input_args,
+            total_duration,
+        )
+
     # Build ffmpeg command
     inputs = []
     filter_parts = []
 
     # Add input files and normalize filters
     for i, v in enumerate(videos):
-        inputs.extend(["-i", v["path"]])
+        inputs.extend([*input_args, "-i", v["path"]])
         rotation = v.get("rotation", 0)
 
         if v["is_portrait"]:
             filter_parts.append(build_portrait_filter(i, rotation))
+        elif rotation == 0 and _matches_target(v):
+            # Already 1920x1080@30 - skip the scaler and pad entirely
+            filter_parts.append(_passthrough_filter(i))
         else:
             filter_parts.append(build_landscape_filter(i, rotation))
 
@@ -1176,94 +2271,116 @@ def compile_movie(
         filter_parts.append("[a0]anull[aout]")
     else:
         # Multiple videos - chain xfade transitions
-        cumulative_duration = 0
-
-        for i in range(len(videos) - 1):
-            if i == 0:
-                v_in1 = f"[v{i}]"
-                a_in1 = f"[a{i}]"
-            else:
-                v_in1 = f"[vt{i - 1}]"
-                a_in1 = f"[at{i - 1}]"
-
-            v_in2 = f"[v{i + 1}]"
-            a_in2 = f"[a{i + 1}]"
-
-            # Calculate offset: cumulative duration minus transitions already applied
-            offset = cumulative_duration + videos[i]["duration"] - TRANSITION_DURATION
-            cumulative_duration = offset
-
-            if i == len(videos) - 2:
-                v_out = "[vout]"
-                a_out = "[aout]"
-            else:
-                v_out = f"[vt{i}]"
-                a_out = f"[at{i}]"
-
-            filter_parts.append(
-                f"{v_in1}{v_in2}xfade=transition=fade:duration={TRANSITION_DURATION}:offset={offset:.3f}{v_out}"
-            )
-            filter_parts.append(
-                f"{a_in1}{a_in2}acrossfade=d={TRANSITION_DURATION}:c1=tri:c2=tri{a_out}"
-            )
+        filter_parts.extend(_xfade_filter_parts(videos, "[v{i}]", "[a{i}]"))
+
+    # Extra renditions ride the same decode + filter graph; a filter label
+    # can only feed one output, so fan [vout]/[aout] out through split.
+    extra_tiers = [
+        t
+        for t in (renditions or [])
+        if t != quality_tier and t in enc_settings["quality_values"]
+    ]
+    tiers = [quality_tier, *extra_tiers]
+    if len(tiers) > 1:
+        v_labels = [f"[vout{i}]" for i in range(len(tiers))]
+        a_labels = [f"[aout{i}]" for i in range(len(tiers))]
+        filter_parts.append(f"[vout]split={len(tiers)}{''.join(v_labels)}")
+        filter_parts.append(f"[aout]asplit={len(tiers)}{''.join(a_labels)}")
+    else:
+        v_labels = ["[vout]"]
+        a_labels = ["[aout]"]
 
     filter_complex = ";".join(filter_parts)
 
-    # Build encoder-specific command
-    cmd = ["ffmpeg", "-y"]
-    cmd.extend(inputs)
-    cmd.extend(
-        [
-            "-filter_complex",
-            filter_complex,
+    def _output_block(tier: str, v_label: str, a_label: str, path: Path) -> list[str]:
+        """Per-output encoder arguments; repeated once per rendition."""
+        block = [
             "-map",
-            "[vout]",
+            v_label,
             "-map",
-            "[aout]",
+            a_label,
             "-c:v",
             encoder,
             "-pix_fmt",
             enc_settings["pix_fmt"],
             enc_settings["quality_flag"],
-            enc_settings["quality_values"][quality_tier],
+            enc_settings["quality_values"][tier],
+            *enc_settings.get("extra_args", []),
         ]
-    )
 
-    # Add encoder-specific extra args
-    cmd.extend(enc_settings.get("extra_args", []))
+        # Add preset for CPU encoder (libx265 only)
+        if encoder == "libx265" and "presets" in enc_settings:
+            block.extend(["-preset", enc_settings["presets"][tier]])
+            block.extend(["-threads", "0"])  # all cores; HW encoders ignore it
+            if tier == "high":
+                block.extend(["-tune", "fastdecode", "-x265-params", "aq-mode=3"])
 
-    # Add preset for CPU encoder (libx265 only)
-    if encoder == "libx265" and "presets" in enc_settings:
-        cmd.extend(["-preset", enc_settings["presets"][quality_tier]])
-        if quality_tier == "high":
-            cmd.extend(["-tune", "fastdecode", "-x265-params", "aq-mode=3"])
+        block.extend(
+            [
+                "-tag:v",
+                "hvc1",  # For Apple compatibility
+                "-c:a",
+                "aac",
+                "-b:a",
+                "192k",
+                "-movflags",
+                "+faststart",
+                str(path),
+            ]
+        )
+        return block
 
-    cmd.extend(
-        [
-            "-tag:v",
-            "hvc1",  # For Apple compatibility
-            "-c:a",
-            "aac",
-            "-b:a",
-            "192k",
-            "-movflags",
-            "+faststart",
-            str(output_path),
-        ]
-    )
+    # Build encoder-specific command
+    cmd = ["ffmpeg", "-y"]
+    cmd.extend(inputs)
+    if encoder == "libx265":
+        # CPU path: run the filter graph across all cores too - the
+        # scale/blur chain otherwise serializes behind one graph thread
+        cmd.extend(["-filter_complex_threads", str(os.cpu_count() or 2)])
+    cmd.extend(["-filter_complex", filter_complex])
+    for i, tier in enumerate(tiers):
+        path = (
+            output_path
+            if i == 0
+            else output_path.with_name(f"{output_path.stem}_{tier}{output_path.suffix}")
+        )
+        cmd.extend(_output_block(tier, v_labels[i], a_labels[i], path))
+
+    # Persist the assembled command so --recompile can replay it without
+    # re-running encoder detection or rebuilding the filter graph. The
+    # primary output is recorded explicitly - with --renditions the
+    # command's last argument is the last rendition's path, not this one.
+    playlist["last_cmd"] = cmd
+    playlist["last_output"] = str(output_path)
+    try:
+        with playlist_path.open("w") as f:
+            json.dump(playlist, f, indent=2)
+    except OSError:
+        pass  # Replay cache only; the encode proceeds regardless
 
     # Show command info
     console.print("[dim]Running ffmpeg...[/dim]")
     console.print(f"[dim]Output: {output_path}[/dim]")
     console.print(f"[dim]Estimated duration: {format_duration(total_duration)}[/dim]\n")
 
+    return _run_ffmpeg_with_progress(cmd, total_duration, output_path)
+
+
+def _run_ffmpeg_with_progress(
+    cmd: list[str], total_duration: float, output_path: Path
+) -> Path | None:
+    """Run an ffmpeg encode, driving a Rich progress bar from its output."""
     try:
-        # Run ffmpeg with progress bar
+        # -progress pipe:1 emits a compact key=value stream (microsecond
+        # precision) instead of the verbose stats line, so the loop below
+        # does a bytes prefix check per line rather than a regex search.
+        # Binary mode with a large buffer keeps Python off the encode's
+        # critical path.
         process = subprocess.Popen(
-            cmd,
+            [cmd[0], "-progress", "pipe:1", "-nostats", *cmd[1:]],
             stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            universal_newlines=True,
+            stderr=subprocess.DEVNULL,
+            bufsize=1024 * 64,
         )
 
         # Use Rich progress bar instead of raw ffmpeg output
@@ -1280,17 +2397,16 @@ def compile_movie(
 
             assert process.stdout is not None
             for line in process.stdout:
-                # Parse time=HH:MM:SS.ms from ffmpeg output
-                if "time=" in line:
-                    time_match = re.search(
-                        r"time=(\d{2}):(\d{2}):(\d{2})\.(\d{2})", line
+                # out_time_ms is the encoded position in microseconds
+                # (despite the name); other key=value lines are skipped
+                if line.startswith(b"out_time_ms="):
+                    try:
+                        current_seconds = int(line[12:]) / 1_000_000
+                    except ValueError:
+                        continue  # ffmpeg emits N/A before the first frame
+                    progress.update(
+                        task, completed=min(current_seconds, total_duration)
                     )
-                    if time_match:
-                        h, m, s, ms = map(int, time_match.groups())
-                        current_seconds = h * 3600 + m * 60 + s + ms / 100
-                        progress.update(
-                            task, completed=min(current_seconds, total_duration)
-                        )
 
         process.wait()
 
@@ -1331,8 +2447,45 @@ def main() -> None:
         metavar="PLAYLIST",
         help="Recompile from existing playlist.json file",
     )
+    parser.add_argument(
+        "--prefetch",
+        action="store_true",
+        help="Download iCloud-only videos concurrently before exporting",
+    )
+    parser.add_argument(
+        "--no-transitions",
+        action="store_true",
+        help="Concatenate clips without crossfades (enables stream-copy fast path)",
+    )
+    parser.add_argument(
+        "--strict-probe",
+        action="store_true",
+        help="Verify encoders with a test encode instead of trusting ffmpeg's listing",
+    )
+    parser.add_argument(
+        "--segmented",
+        action="store_true",
+        help="Normalize clips in parallel ffmpeg passes before joining with crossfades",
+    )
+    parser.add_argument(
+        "--renditions",
+        type=str,
+        metavar="TIERS",
+        help="Extra quality tiers to emit in the same encode pass "
+        "(comma-separated: high,balanced,fast)",
+    )
+    parser.add_argument(
+        "--no-prefetch-db",
+        action="store_true",
+        help="Load the Photos library synchronously (for debugging)",
+    )
     args = parser.parse_args()
 
+    global _strict_probe
+    _strict_probe = args.strict_probe
+
+    renditions = args.renditions.split(",") if args.renditions else None
+
     # Handle recompile mode
     if args.recompile:
         playlist_path = Path(args.recompile)
@@ -1344,20 +2497,52 @@ def main() -> None:
             f"\n[bold cyan]Recompiling: {playlist_path.parent.name}[/bold cyan]\n"
         )
 
-        # Delete existing output files (could have descriptive name)
-        existing_outputs = list(playlist_path.parent.glob("*.mp4"))
-        for old_output in existing_outputs:
-            old_output.unlink()
-            console.print(f"[dim]Removed existing {old_output.name}[/dim]")
+        # Delete existing output files (could have descriptive name);
+        # one scandir pass instead of a glob walk
+        for entry in os.scandir(playlist_path.parent):
+            if entry.name.endswith(".mp4"):
+                os.unlink(entry.path)
+                console.print(f"[dim]Removed existing {entry.name}[/dim]")
+
+        # Replay the previous encode verbatim when one was recorded -
+        # skips encoder detection, prompts, and filter-graph rebuild
+        with playlist_path.open() as f:
+            replay_playlist = json.load(f)
+        last_cmd = replay_playlist.get("last_cmd")
+        if (
+            last_cmd
+            and questionary.confirm(
+                "Replay previous encode settings?", default=True
+            ).ask()
+        ):
+            replay_videos = replay_playlist["videos"]
+            total_duration = sum(v["duration"] for v in replay_videos)
+            if len(replay_videos) > 1:
+                total_duration -= (len(replay_videos) - 1) * TRANSITION_DURATION
+            # Older playlists predate last_output; their commands were
+            # single-output, so the final argument is the primary file
+            output = Path(replay_playlist.get("last_output") or last_cmd[-1])
+            _run_ffmpeg_with_progress(last_cmd, total_duration, output)
+            return
 
         # Prompt for quality selection
         encoding = prompt_quality_selection()
-        compile_movie(playlist_path, encoding)
+        compile_movie(
+            playlist_path,
+            encoding,
+            use_transitions=not args.no_transitions,
+            segmented=args.segmented,
+            renditions=renditions,
+        )
         return
 
     console.print("\n[bold cyan]Video Compiler[/bold cyan]")
     console.print("[dim]Create compilation videos from your Photos library[/dim]\n")
 
+    # Start loading the Photos library while the user fills in the prompts
+    if not args.no_prefetch_db:
+        _start_photosdb_load()
+
     # Step 1: Date range
     start_date, end_date = prompt_date_range()
 
@@ -1414,7 +2599,9 @@ def main() -> None:
         console.print("[dim]Cancelled[/dim]")
         return
 
-    # Step 6: Export videos
+    # Step 6: Export videos (optionally prefetching iCloud assets in parallel)
+    if args.prefetch:
+        _prefetch_missing(videos)
     exported = export_videos(videos)
 
     if not exported:
@@ -1456,7 +2643,13 @@ def main() -> None:
     if questionary.confirm("\nGenerate final movie now?", default=True).ask():
         # Prompt for quality selection
         encoding = prompt_quality_selection()
-        output_path = compile_movie(playlist_path, encoding)
+        output_path = compile_movie(
+            playlist_path,
+            encoding,
+            use_transitions=not args.no_transitions,
+            segmented=args.segmented,
+            renditions=renditions,
+        )
 
         if output_path:
             console.print("\n[bold green]Done![/bold green]")
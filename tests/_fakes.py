@@ -0,0 +1,75 @@
+"""Fake osxphotos video objects shared across the Montage test suite."""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import NamedTuple
+from unittest.mock import MagicMock
+
+
+class MockExifInfo(NamedTuple):
+    """Mock exif_info for video objects."""
+
+    duration: float
+
+
+class MockPlace(NamedTuple):
+    """Mock place info for video objects."""
+
+    name: str | None
+
+
+@dataclass(eq=False, slots=True, weakref_slot=True)
+class FakeVideo:
+    """Lightweight stand-in for an osxphotos video object.
+
+    Exposes just the attribute surface main.py reads, at a fraction of
+    the construction cost of a MagicMock.  ``eq=False`` keeps identity
+    hashing and ``weakref_slot`` keeps the instances usable as keys in
+    main's WeakKeyDictionary memos; ``export`` stays a MagicMock so
+    tests can stub return values and assert calls.
+    """
+
+    uuid: str
+    date: datetime
+    persons: list[str]
+    width: int
+    height: int
+    original_filename: str
+    original_filesize: int
+    intrash: bool
+    ismissing: bool
+    exif_info: MockExifInfo | None
+    place: MockPlace | None
+    path: str | None  # Path to video file for playback
+    export: MagicMock = field(default_factory=MagicMock)
+
+
+def create_mock_video(
+    uuid: str = "test-uuid-001",
+    date: datetime | None = None,
+    duration: float = 30.0,
+    persons: list[str] | None = None,
+    width: int = 1920,
+    height: int = 1080,
+    original_filename: str = "test_video.mov",
+    original_filesize: int = 1024 * 1024 * 100,  # 100 MB
+    intrash: bool = False,
+    ismissing: bool = False,
+    place_name: str | None = None,
+    path: str | None = "/path/to/video.mov",
+) -> FakeVideo:
+    """Factory for creating mock osxphotos video objects."""
+    return FakeVideo(
+        uuid=uuid,
+        date=date or datetime(2024, 6, 15, 10, 30, 0),
+        persons=persons if persons is not None else [],
+        width=width,
+        height=height,
+        original_filename=original_filename,
+        original_filesize=original_filesize,
+        intrash=intrash,
+        ismissing=ismissing,
+        exif_info=MockExifInfo(duration=duration),
+        place=MockPlace(name=place_name) if place_name else None,
+        path=path,
+    )
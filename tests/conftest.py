@@ -1,61 +1,26 @@
 """Shared fixtures for Montage test suite."""
 
 import json
+import subprocess
 import sys
-from dataclasses import dataclass
+import types
 from datetime import datetime
 from unittest.mock import MagicMock
 
 import pytest
 
-# Mock osxphotos before importing main (for environments without osxphotos installed)
+# Stub osxphotos before importing main (for environments without osxphotos
+# installed).  A plain module with just the symbol main.py uses keeps memory
+# flat across the session, unlike a MagicMock whose lazily created child
+# mocks accumulate; tests patch main.osxphotos.PhotosDB per-test anyway.
 if "osxphotos" not in sys.modules:
-    sys.modules["osxphotos"] = MagicMock()
-
-
-@dataclass
-class MockExifInfo:
-    """Mock exif_info for video objects."""
-
-    duration: float
-
-
-@dataclass
-class MockPlace:
-    """Mock place info for video objects."""
-
-    name: str | None
-
-
-def create_mock_video(
-    uuid: str = "test-uuid-001",
-    date: datetime | None = None,
-    duration: float = 30.0,
-    persons: list[str] | None = None,
-    width: int = 1920,
-    height: int = 1080,
-    original_filename: str = "test_video.mov",
-    original_filesize: int = 1024 * 1024 * 100,  # 100 MB
-    intrash: bool = False,
-    ismissing: bool = False,
-    place_name: str | None = None,
-    path: str | None = "/path/to/video.mov",
-) -> MagicMock:
-    """Factory for creating mock osxphotos video objects."""
-    video = MagicMock()
-    video.uuid = uuid
-    video.date = date or datetime(2024, 6, 15, 10, 30, 0)
-    video.persons = persons if persons is not None else []
-    video.width = width
-    video.height = height
-    video.original_filename = original_filename
-    video.original_filesize = original_filesize
-    video.intrash = intrash
-    video.ismissing = ismissing
-    video.exif_info = MockExifInfo(duration=duration)
-    video.place = MockPlace(name=place_name) if place_name else None
-    video.path = path  # Path to video file for playback
-    return video
+    _osxphotos_stub = types.ModuleType("osxphotos")
+    _osxphotos_stub.PhotosDB = type("PhotosDB", (), {})
+    sys.modules["osxphotos"] = _osxphotos_stub
+
+# The fake video classes live in _fakes.py so test modules and this conftest
+# share a single definition (pytest puts this directory on sys.path).
+from _fakes import create_mock_video
 
 
 @pytest.fixture
@@ -136,40 +101,6 @@ def mock_console(mocker):
     return mocker.patch("main.console")
 
 
-@pytest.fixture
-def hevc_videotoolbox_settings():
-    """Expected settings for HEVC VideoToolbox encoder."""
-    return {
-        "quality_flag": "-q:v",
-        "quality_values": {"high": "50", "balanced": "60", "fast": "70"},
-        "extra_args": ["-allow_sw", "1"],
-        "pix_fmt": "yuv420p",
-    }
-
-
-@pytest.fixture
-def h264_videotoolbox_settings():
-    """Expected settings for H.264 VideoToolbox encoder."""
-    return {
-        "quality_flag": "-q:v",
-        "quality_values": {"high": "50", "balanced": "60", "fast": "70"},
-        "extra_args": ["-allow_sw", "1"],
-        "pix_fmt": "yuv420p",
-    }
-
-
-@pytest.fixture
-def libx265_settings():
-    """Expected settings for libx265 CPU encoder."""
-    return {
-        "quality_flag": "-crf",
-        "quality_values": {"high": "20", "balanced": "22", "fast": "24"},
-        "presets": {"high": "slow", "balanced": "medium", "fast": "fast"},
-        "extra_args": [],
-        "pix_fmt": "yuv420p10le",
-    }
-
-
 @pytest.fixture
 def temp_project_dir(tmp_path):
     """Create a temporary project directory structure."""
@@ -178,9 +109,11 @@ def temp_project_dir(tmp_path):
     return project_dir
 
 
-@pytest.fixture
-def sample_playlist(tmp_path):
-    """Create a sample playlist.json for testing."""
+# The playlist fixtures serialize once per session; per-test work is just a
+# mkdir and a write of the cached bytes into tmp_path.
+@pytest.fixture(scope="session")
+def _sample_playlist_bytes():
+    """Serialized sample playlist, built once per session."""
     playlist_data = {
         "created": "2024-06-15T12:00:00",
         "project_name": "test_project",
@@ -205,18 +138,23 @@ def sample_playlist(tmp_path):
             }
         ],
     }
+    return json.dumps(playlist_data, separators=(",", ":")).encode()
 
+
+@pytest.fixture
+def sample_playlist(tmp_path, _sample_playlist_bytes):
+    """Create a sample playlist.json for testing."""
     project_dir = tmp_path / "projects" / "test_project"
     project_dir.mkdir(parents=True)
     playlist_path = project_dir / "playlist.json"
-    playlist_path.write_text(json.dumps(playlist_data, indent=2))
+    playlist_path.write_bytes(_sample_playlist_bytes)
 
     return playlist_path
 
 
-@pytest.fixture
-def sample_playlist_multiple_videos(tmp_path):
-    """Create a playlist with multiple videos for transition testing."""
+@pytest.fixture(scope="session")
+def _multi_playlist_bytes():
+    """Serialized multi-video playlist, built once per session."""
     playlist_data = {
         "created": "2024-06-15T12:00:00",
         "project_name": "test_project",
@@ -263,11 +201,16 @@ def sample_playlist_multiple_videos(tmp_path):
             },
         ],
     }
+    return json.dumps(playlist_data, separators=(",", ":")).encode()
 
+
+@pytest.fixture
+def sample_playlist_multiple_videos(tmp_path, _multi_playlist_bytes):
+    """Create a playlist with multiple videos for transition testing."""
     project_dir = tmp_path / "projects" / "multi_video_project"
     project_dir.mkdir(parents=True)
     playlist_path = project_dir / "playlist.json"
-    playlist_path.write_text(json.dumps(playlist_data, indent=2))
+    playlist_path.write_bytes(_multi_playlist_bytes)
 
     return playlist_path
 
@@ -338,13 +281,22 @@ def mock_mpv_unavailable(mocker):
     mocker.patch("main._check_mpv_available", return_value=False)
 
 
+@pytest.fixture(scope="session")
+def _mpv_process_singleton():
+    """One shared mpv process mock; mock_mpv_available resets it per test.
+
+    spec bounds the mock to the real Popen API, so a typo'd method in a
+    test or in main fails loudly instead of silently auto-mocking.
+    """
+    return MagicMock(spec=subprocess.Popen)
+
+
 @pytest.fixture
-def mock_mpv_available(mocker):
+def mock_mpv_available(mocker, _mpv_process_singleton):
     """Mock mpv as available with subprocess."""
     mocker.patch("main._check_mpv_available", return_value=True)
-    # Mock subprocess.Popen to return a mock process
-    mock_process = MagicMock()
-    mock_process.terminate = MagicMock()
-    mock_process.wait = MagicMock()
-    mocker.patch("subprocess.Popen", return_value=mock_process)
-    return mock_process
+    # Reuse one process mock across tests; resetting is cheaper than
+    # rebuilding the MagicMock tree (terminate/wait children included)
+    _mpv_process_singleton.reset_mock(return_value=True, side_effect=True)
+    mocker.patch("subprocess.Popen", return_value=_mpv_process_singleton)
+    return _mpv_process_singleton
@@ -1,21 +1,141 @@
 """Tests for encoder detection functions with subprocess mocking."""
 
 import subprocess
-import sys
-from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
+import main
 from main import (
     ENCODER_NAMES,
     _encoder_cache,
+    _get_encoder_settings,
+    _list_ffmpeg_encoders,
+    _list_ffmpeg_hwaccels,
     _test_encoder,
     _test_gpu_availability,
     detect_best_encoder,
 )
 
+# Sample `ffmpeg -hide_banner -encoders` output for parser tests
+FFMPEG_ENCODERS_OUTPUT = """\
+Encoders:
+ V..... = Video
+ A..... = Audio
+ S..... = Subtitle
+ .F.... = Frame-level multithreading
+ ..S... = Slice-level multithreading
+ ...X.. = Codec is experimental
+ ....B. = Supports draw_horiz_band
+ .....D = Supports direct rendering method 1
+ ------
+ V....D libx264              libx264 H.264 / AVC / MPEG-4 AVC (codec h264)
+ V....D h264_videotoolbox    VideoToolbox H.264 Encoder (codec h264)
+ V....D libx265              libx265 H.265 / HEVC (codec hevc)
+ V....D hevc_videotoolbox    VideoToolbox H.265 Encoder (codec hevc)
+ A....D aac                  AAC (Advanced Audio Coding)
+"""
+
+
+def fake_probe(*available: str):
+    """Build a _test_encoder side effect: ok iff the encoder is in `available`."""
+    return lambda encoder, timeout=10: (encoder, encoder in available)
+
+
+def mock_encoder_listing(mocker, *encoders: str):
+    """Mock _list_ffmpeg_encoders to report the given encoders as available."""
+    return mocker.patch("main._list_ffmpeg_encoders", return_value=set(encoders))
+
+
+class TestListFfmpegEncoders:
+    """Tests for _list_ffmpeg_encoders() parsing and caching."""
+
+    @pytest.fixture(autouse=True)
+    def clear_listing_cache(self):
+        """Reset the cached listing before and after each test."""
+        main._ffmpeg_encoders = None
+        yield
+        main._ffmpeg_encoders = None
+
+    def test_parses_encoder_names(self, mocker):
+        """Encoder names are extracted from the listing output."""
+        mock_run = mocker.patch("main.subprocess.run")
+        mock_run.return_value.stdout = FFMPEG_ENCODERS_OUTPUT
+
+        encoders = _list_ffmpeg_encoders()
+
+        assert "hevc_videotoolbox" in encoders
+        assert "h264_videotoolbox" in encoders
+        assert "libx265" in encoders
+        assert "aac" in encoders
+
+    def test_legend_lines_not_parsed_as_encoders(self, mocker):
+        """The legend at the top of the output is not mistaken for encoders."""
+        mock_run = mocker.patch("main.subprocess.run")
+        mock_run.return_value.stdout = FFMPEG_ENCODERS_OUTPUT
+
+        encoders = _list_ffmpeg_encoders()
+
+        assert "=" not in "".join(encoders)
+        assert "Video" not in encoders
+
+    def test_result_is_cached(self, mocker):
+        """ffmpeg is only invoked once per process."""
+        mock_run = mocker.patch("main.subprocess.run")
+        mock_run.return_value.stdout = FFMPEG_ENCODERS_OUTPUT
+
+        _list_ffmpeg_encoders()
+        _list_ffmpeg_encoders()
+
+        assert mock_run.call_count == 1
+
+    def test_ffmpeg_not_found_returns_empty_set(self, mocker):
+        """Missing ffmpeg yields an empty set rather than raising."""
+        mocker.patch("main.subprocess.run", side_effect=FileNotFoundError())
+
+        assert _list_ffmpeg_encoders() == set()
+
+    def test_timeout_returns_empty_set(self, mocker):
+        """A hung ffmpeg yields an empty set rather than raising."""
+        mocker.patch(
+            "main.subprocess.run", side_effect=subprocess.TimeoutExpired("ffmpeg", 10)
+        )
+
+        assert _list_ffmpeg_encoders() == set()
+
+
+class TestListFfmpegHwaccels:
+    """Tests for _list_ffmpeg_hwaccels() parsing and caching."""
+
+    @pytest.fixture(autouse=True)
+    def clear_hwaccels_cache(self):
+        """Reset the cached listing before and after each test."""
+        main._ffmpeg_hwaccels = None
+        yield
+        main._ffmpeg_hwaccels = None
+
+    def test_parses_hwaccel_names(self, mocker):
+        """Accelerator names are extracted, skipping the header line."""
+        mock_run = mocker.patch("main.subprocess.run")
+        mock_run.return_value.stdout = "Hardware acceleration methods:\nvideotoolbox\n"
+
+        assert _list_ffmpeg_hwaccels() == {"videotoolbox"}
+
+    def test_result_is_cached(self, mocker):
+        """ffmpeg is only invoked once per process."""
+        mock_run = mocker.patch("main.subprocess.run")
+        mock_run.return_value.stdout = "Hardware acceleration methods:\nvideotoolbox\n"
+
+        _list_ffmpeg_hwaccels()
+        _list_ffmpeg_hwaccels()
+
+        assert mock_run.call_count == 1
+
+    def test_ffmpeg_not_found_returns_empty_set(self, mocker):
+        """Missing ffmpeg yields an empty set rather than raising."""
+        mocker.patch("main.subprocess.run", side_effect=FileNotFoundError())
+
+        assert _list_ffmpeg_hwaccels() == set()
+
 
 class TestTestEncoder:
     """Tests for _test_encoder() function using subprocess mocking."""
@@ -28,7 +148,7 @@ class TestTestEncoder:
         )
 
         result = _test_encoder("hevc_videotoolbox")
-        assert result is False
+        assert result == ("hevc_videotoolbox", False)
 
     def test_encoder_timeout(self, mocker):
         """Test when encoder times out."""
@@ -37,14 +157,40 @@ class TestTestEncoder:
         )
 
         result = _test_encoder("hevc_videotoolbox")
-        assert result is False
+        assert result == ("hevc_videotoolbox", False)
 
     def test_ffmpeg_not_found(self, mocker):
         """Test when ffmpeg is not installed."""
         mocker.patch("main.subprocess.run", side_effect=FileNotFoundError())
 
         result = _test_encoder("hevc_videotoolbox")
-        assert result is False
+        assert result == ("hevc_videotoolbox", False)
+
+    def test_successful_probe_returns_true(self, mocker):
+        """A clean ffmpeg exit means the encoder is available."""
+        mocker.patch("main.subprocess.run")
+
+        result = _test_encoder("hevc_videotoolbox")
+        assert result == ("hevc_videotoolbox", True)
+
+    def test_probe_targets_null_muxer(self, mocker):
+        """The probe should write to the null muxer, not a temp file."""
+        mock_run = mocker.patch("main.subprocess.run")
+
+        _test_encoder("hevc_videotoolbox")
+
+        call_args = mock_run.call_args[0][0]
+        assert call_args[-3:] == ["-f", "null", "-"]
+
+    def test_probe_encodes_single_frame(self, mocker):
+        """The probe should only encode one frame, not a full second."""
+        mock_run = mocker.patch("main.subprocess.run")
+
+        _test_encoder("hevc_videotoolbox")
+
+        call_args = mock_run.call_args[0][0]
+        assert "-frames:v" in call_args
+        assert "-t" not in call_args
 
     def test_hevc_videotoolbox_includes_allow_sw_flag(self, mocker):
         """Verify HEVC VideoToolbox encoder gets -allow_sw flag."""
@@ -105,7 +251,7 @@ class TestTestEncoder:
 
         # This should not raise - temp directory handling is internal
         result = _test_encoder("hevc_videotoolbox")
-        assert result is False
+        assert result == ("hevc_videotoolbox", False)
 
     def test_timeout_parameter_passed(self, mocker):
         """Verify timeout is passed to subprocess.run."""
@@ -119,28 +265,129 @@ class TestTestEncoder:
         assert "timeout" in call_kwargs
 
 
-class TestDetectBestEncoder:
-    """Tests for detect_best_encoder() function."""
+class TestEncoderDiskCache:
+    """Tests for the on-disk encoder cache."""
 
     @pytest.fixture(autouse=True)
-    def clear_encoder_cache(self):
-        """Clear the encoder cache before each test."""
+    def isolated_cache(self, mocker, tmp_path):
+        """Point the disk cache at a temp file and reset in-process state."""
         _encoder_cache.clear()
+        mocker.patch.object(
+            main, "ENCODER_CACHE_PATH", tmp_path / "montage" / "encoders.json"
+        )
+        mocker.patch.object(main, "_encoder_cache_loaded", False)
         yield
         _encoder_cache.clear()
 
+    def test_save_and_load_roundtrip(self, mocker):
+        """Detection results survive a save/load cycle."""
+        mocker.patch("main._encoder_cache_fingerprint", return_value="abc123")
+        mock_encoder_listing(mocker, "hevc_videotoolbox", "h264_videotoolbox")
+
+        first = detect_best_encoder("hevc")
+        assert main.ENCODER_CACHE_PATH.exists()
+
+        # Simulate a fresh process: empty in-memory cache, reload from disk
+        _encoder_cache.clear()
+        main._encoder_cache_loaded = False
+
+        second = detect_best_encoder("hevc")
+        assert second == first
+
+    def test_warm_run_skips_probing(self, mocker):
+        """A fingerprint-matching cache file avoids the ffmpeg listing call."""
+        mocker.patch("main._encoder_cache_fingerprint", return_value="abc123")
+        mock_encoder_listing(mocker, "hevc_videotoolbox")
+        detect_best_encoder("hevc")
+
+        _encoder_cache.clear()
+        main._encoder_cache_loaded = False
+        mock_listing = mock_encoder_listing(mocker)  # would yield libx265 if consulted
+
+        encoder, _settings, _tested = detect_best_encoder("hevc")
+
+        assert encoder == "hevc_videotoolbox"
+        mock_listing.assert_not_called()
+
+    def test_stale_fingerprint_invalidates_cache(self, mocker):
+        """A changed ffmpeg install ignores the old cache file."""
+        mocker.patch("main._encoder_cache_fingerprint", return_value="abc123")
+        mock_encoder_listing(mocker, "hevc_videotoolbox")
+        detect_best_encoder("hevc")
+
+        _encoder_cache.clear()
+        main._encoder_cache_loaded = False
+        mocker.patch("main._encoder_cache_fingerprint", return_value="different")
+        mock_encoder_listing(mocker)
+
+        encoder, _settings, _tested = detect_best_encoder("hevc")
+
+        assert encoder == "libx265"
+
+    def test_corrupt_cache_file_ignored(self, mocker):
+        """A corrupt cache file falls back to probing."""
+        mocker.patch("main._encoder_cache_fingerprint", return_value="abc123")
+        main.ENCODER_CACHE_PATH.parent.mkdir(parents=True)
+        main.ENCODER_CACHE_PATH.write_text("{not json")
+        mock_encoder_listing(mocker, "hevc_videotoolbox")
+
+        encoder, _settings, _tested = detect_best_encoder("hevc")
+
+        assert encoder == "hevc_videotoolbox"
+
+    def test_no_ffmpeg_no_cache_file(self, mocker):
+        """Without a fingerprint (no ffmpeg), nothing is written to disk."""
+        mocker.patch("main._encoder_cache_fingerprint", return_value=None)
+        mock_encoder_listing(mocker)
+
+        detect_best_encoder("hevc")
+
+        assert not main.ENCODER_CACHE_PATH.exists()
+
+    def test_gpu_availability_cached_on_disk(self, mocker):
+        """_test_gpu_availability results are persisted as well."""
+        mocker.patch("main._encoder_cache_fingerprint", return_value="abc123")
+        mock_encoder_listing(mocker, "h264_videotoolbox")
+        first = _test_gpu_availability()
+
+        _encoder_cache.clear()
+        main._encoder_cache_loaded = False
+        mock_listing = mock_encoder_listing(mocker)
+
+        second = _test_gpu_availability()
+
+        assert second == first
+        assert second[:2] == (True, "h264_videotoolbox")
+        mock_listing.assert_not_called()
+
+
+class TestDetectBestEncoder:
+    """Tests for detect_best_encoder() function."""
+
+    @pytest.fixture(autouse=True)
+    def clear_encoder_cache(self, mocker):
+        """Swap in a fresh in-memory cache and disable the on-disk cache.
+
+        Patching the module attribute (restored automatically on teardown)
+        means the shared dict is never mutated, so isolation does not depend
+        on paired clear() calls running.
+        """
+        mocker.patch.object(main, "_encoder_cache", {})
+        mocker.patch("main._load_encoder_cache")
+        mocker.patch("main._save_encoder_cache")
+
     def test_hevc_videotoolbox_preferred_when_available(self, mocker):
-        """When HEVC VideoToolbox works, it should be selected first."""
-        mocker.patch("main._test_encoder", return_value=True)
+        """When HEVC VideoToolbox is listed, it should be selected first."""
+        mock_encoder_listing(mocker, "hevc_videotoolbox", "h264_videotoolbox")
 
         encoder, _settings, tested = detect_best_encoder("hevc")
 
         assert encoder == "hevc_videotoolbox"
-        assert tested == ["hevc_videotoolbox"]
+        assert tested == ["hevc_videotoolbox", "h264_videotoolbox"]
 
     def test_fallback_to_h264_videotoolbox(self, mocker):
-        """When HEVC fails, fall back to H.264 VideoToolbox."""
-        mocker.patch("main._test_encoder", side_effect=[False, True])
+        """When HEVC is not listed, fall back to H.264 VideoToolbox."""
+        mock_encoder_listing(mocker, "h264_videotoolbox")
 
         encoder, _settings, tested = detect_best_encoder("hevc")
 
@@ -149,29 +396,33 @@ class TestDetectBestEncoder:
         assert "h264_videotoolbox" in tested
 
     def test_fallback_to_cpu_libx265(self, mocker):
-        """When all GPU encoders fail, fall back to libx265."""
-        mocker.patch("main._test_encoder", return_value=False)
+        """When no GPU encoder is listed, fall back to libx265."""
+        mock_encoder_listing(mocker)
 
         encoder, _settings, tested = detect_best_encoder("hevc")
 
         assert encoder == "libx265"
-        assert len(tested) == 2  # Both GPU encoders were tested
+        assert len(tested) == 2  # Both GPU encoders were considered
 
-    def test_caching_prevents_repeated_tests(self, mocker):
-        """Encoder detection should be cached to avoid repeated tests."""
-        mock_test = mocker.patch("main._test_encoder", return_value=True)
+    def test_caching_prevents_repeated_listing(self, mocker):
+        """Encoder detection should be cached to avoid repeated listings."""
+        mock_listing = mock_encoder_listing(
+            mocker, "hevc_videotoolbox", "h264_videotoolbox"
+        )
 
         # First call
         detect_best_encoder("hevc")
         # Second call should use cache
         detect_best_encoder("hevc")
 
-        # Should only test once because of caching
-        assert mock_test.call_count == 1
+        # Should only consult the listing once because of caching
+        assert mock_listing.call_count == 1
 
     def test_different_codec_not_cached(self, mocker):
         """Different codec parameter should not use same cache."""
-        mock_test = mocker.patch("main._test_encoder", return_value=True)
+        mock_listing = mock_encoder_listing(
+            mocker, "hevc_videotoolbox", "h264_videotoolbox"
+        )
 
         # First call with hevc
         detect_best_encoder("hevc")
@@ -179,40 +430,92 @@ class TestDetectBestEncoder:
         # So this tests the cache key includes the codec
         detect_best_encoder("hevc")  # Same codec, should be cached
 
-        assert mock_test.call_count == 1
+        assert mock_listing.call_count == 1
 
-    def test_returns_correct_settings_for_hevc_videotoolbox(self, mocker):
-        """Verify settings match hevc_videotoolbox when that encoder is selected."""
-        mocker.patch("main._test_encoder", return_value=True)
+    def test_no_test_encode_by_default(self, mocker):
+        """Without --strict-probe, no test encode is performed."""
+        mock_encoder_listing(mocker, "hevc_videotoolbox", "h264_videotoolbox")
+        mock_test = mocker.patch("main._test_encoder")
 
-        encoder, settings, _ = detect_best_encoder("hevc")
+        detect_best_encoder("hevc")
 
-        assert encoder == "hevc_videotoolbox"
-        assert settings["quality_flag"] == "-q:v"
-        assert "-allow_sw" in settings["extra_args"]
+        mock_test.assert_not_called()
 
-    def test_returns_correct_settings_for_h264_videotoolbox(self, mocker):
-        """Verify settings match h264_videotoolbox when that encoder is selected."""
-        mocker.patch("main._test_encoder", side_effect=[False, True])
+    def test_strict_probe_verifies_listed_encoders(self, mocker):
+        """With --strict-probe, listed encoders are verified by a test encode."""
+        mock_encoder_listing(mocker, "hevc_videotoolbox", "h264_videotoolbox")
+        mocker.patch("main._test_encoder", side_effect=fake_probe("h264_videotoolbox"))
+        mocker.patch.object(main, "_strict_probe", True)
+        mocker.patch("main.platform.machine", return_value="x86_64")
 
-        encoder, settings, _ = detect_best_encoder("hevc")
+        encoder, _settings, _tested = detect_best_encoder("hevc")
 
+        # HEVC is listed but fails the real encode; H.264 passes
         assert encoder == "h264_videotoolbox"
-        assert settings["quality_flag"] == "-q:v"
 
-    def test_returns_correct_settings_for_libx265(self, mocker):
-        """Verify settings match libx265 when CPU fallback is used."""
-        mocker.patch("main._test_encoder", return_value=False)
+    def test_strict_probe_all_fail_falls_back_to_cpu(self, mocker):
+        """With --strict-probe, fall back to CPU when all verifications fail."""
+        mock_encoder_listing(mocker, "hevc_videotoolbox", "h264_videotoolbox")
+        mocker.patch("main._test_encoder", side_effect=fake_probe())
+        mocker.patch.object(main, "_strict_probe", True)
+        mocker.patch("main.platform.machine", return_value="x86_64")
 
-        encoder, settings, _ = detect_best_encoder("hevc")
+        encoder, _settings, _tested = detect_best_encoder("hevc")
 
         assert encoder == "libx265"
-        assert settings["quality_flag"] == "-crf"
-        assert "presets" in settings
+
+    def test_strict_probe_ignores_warm_nonstrict_cache(self, mocker):
+        """A warm non-strict cache entry must not satisfy --strict-probe."""
+        mock_encoder_listing(mocker, "hevc_videotoolbox", "h264_videotoolbox")
+        detect_best_encoder("hevc")  # warm the cache with an unverified result
+
+        mocker.patch.object(main, "_strict_probe", True)
+        mocker.patch("main.platform.machine", return_value="x86_64")
+        mock_test = mocker.patch(
+            "main._test_encoder", side_effect=fake_probe("h264_videotoolbox")
+        )
+
+        encoder, _settings, _tested = detect_best_encoder("hevc")
+
+        # The cached hevc_videotoolbox answer is ignored; verification runs
+        # and demotes to the encoder that actually passed
+        mock_test.assert_called()
+        assert encoder == "h264_videotoolbox"
+
+    def test_strict_probe_skipped_on_apple_silicon(self, mocker):
+        """On arm64, the listing is trusted even under --strict-probe."""
+        mock_encoder_listing(mocker, "hevc_videotoolbox", "h264_videotoolbox")
+        mock_test = mocker.patch("main._test_encoder")
+        mocker.patch.object(main, "_strict_probe", True)
+        mocker.patch("main.platform.machine", return_value="arm64")
+
+        encoder, _settings, _tested = detect_best_encoder("hevc")
+
+        assert encoder == "hevc_videotoolbox"
+        mock_test.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("listed", "expected_encoder"),
+        [
+            (("hevc_videotoolbox", "h264_videotoolbox"), "hevc_videotoolbox"),
+            (("h264_videotoolbox",), "h264_videotoolbox"),
+            ((), "libx265"),
+        ],
+    )
+    def test_returns_settings_for_selected_encoder(
+        self, mocker, listed, expected_encoder
+    ):
+        """The settings returned must match the selected encoder's table."""
+        mock_encoder_listing(mocker, *listed)
+
+        encoder, settings, _ = detect_best_encoder("hevc")
+
+        assert encoder == expected_encoder
+        assert settings == _get_encoder_settings(expected_encoder)
 
     def test_tested_list_tracks_all_attempts(self, mocker):
-        """Verify the tested list includes all encoders that were tested."""
-        mocker.patch("main._test_encoder", return_value=False)
+        """Verify the tested list includes all encoders that were considered."""
+        mock_encoder_listing(mocker)
 
         _encoder, _settings, tested = detect_best_encoder("hevc")
 
@@ -225,25 +528,37 @@ class TestDetectBestEncoder:
 class TestEncoderNames:
     """Tests for ENCODER_NAMES constant."""
 
-    def test_hevc_videotoolbox_has_friendly_name(self):
-        assert "hevc_videotoolbox" in ENCODER_NAMES
-        assert "GPU" in ENCODER_NAMES["hevc_videotoolbox"]
-
-    def test_h264_videotoolbox_has_friendly_name(self):
-        assert "h264_videotoolbox" in ENCODER_NAMES
-        assert "GPU" in ENCODER_NAMES["h264_videotoolbox"]
-
-    def test_libx265_has_friendly_name(self):
-        assert "libx265" in ENCODER_NAMES
-        assert "CPU" in ENCODER_NAMES["libx265"]
+    @pytest.mark.parametrize(
+        ("name", "tag"),
+        [
+            ("hevc_videotoolbox", "GPU"),
+            ("h264_videotoolbox", "GPU"),
+            ("libx265", "CPU"),
+        ],
+    )
+    def test_friendly_name(self, name, tag):
+        assert name in ENCODER_NAMES
+        assert tag in ENCODER_NAMES[name]
 
 
 class TestTestGpuAvailability:
     """Tests for _test_gpu_availability() function."""
 
+    @pytest.fixture(autouse=True)
+    def clear_encoder_cache(self, mocker):
+        """Swap in a fresh in-memory cache and disable the on-disk cache.
+
+        Patching the module attribute (restored automatically on teardown)
+        means the shared dict is never mutated, so isolation does not depend
+        on paired clear() calls running.
+        """
+        mocker.patch.object(main, "_encoder_cache", {})
+        mocker.patch("main._load_encoder_cache")
+        mocker.patch("main._save_encoder_cache")
+
     def test_returns_true_when_hevc_available(self, mocker):
-        """When HEVC VideoToolbox works, return True with encoder info."""
-        mocker.patch("main._test_encoder", return_value=True)
+        """When HEVC VideoToolbox is listed, return True with encoder info."""
+        mock_encoder_listing(mocker, "hevc_videotoolbox", "h264_videotoolbox")
 
         available, encoder, settings = _test_gpu_availability()
 
@@ -252,9 +567,9 @@ class TestTestGpuAvailability:
         assert settings is not None
         assert settings["quality_flag"] == "-q:v"
 
-    def test_returns_true_with_h264_when_hevc_fails(self, mocker):
-        """When HEVC fails but H.264 works, return True with H.264 encoder."""
-        mocker.patch("main._test_encoder", side_effect=[False, True])
+    def test_returns_true_with_h264_when_hevc_missing(self, mocker):
+        """When HEVC is not listed but H.264 is, return True with H.264 encoder."""
+        mock_encoder_listing(mocker, "h264_videotoolbox")
 
         available, encoder, settings = _test_gpu_availability()
 
@@ -263,8 +578,8 @@ class TestTestGpuAvailability:
         assert settings is not None
 
     def test_returns_false_when_no_gpu_available(self, mocker):
-        """When all GPU encoders fail, return False with None values."""
-        mocker.patch("main._test_encoder", return_value=False)
+        """When no GPU encoder is listed, return False with None values."""
+        mock_encoder_listing(mocker)
 
         available, encoder, settings = _test_gpu_availability()
 
@@ -274,7 +589,7 @@ class TestTestGpuAvailability:
 
     def test_does_not_fallback_to_cpu(self, mocker):
         """Verify that _test_gpu_availability never returns CPU encoder."""
-        mocker.patch("main._test_encoder", return_value=False)
+        mock_encoder_listing(mocker)
 
         available, encoder, _settings = _test_gpu_availability()
 
@@ -282,14 +597,27 @@ class TestTestGpuAvailability:
         assert encoder != "libx265"
         assert available is False
 
-    def test_tests_encoders_in_priority_order(self, mocker):
-        """Verify HEVC is tested before H.264."""
-        mock_test = mocker.patch("main._test_encoder", return_value=False)
+    def test_strict_probe_verifies_listed_encoders(self, mocker):
+        """With --strict-probe, listed encoders are verified by a test encode."""
+        mock_encoder_listing(mocker, "hevc_videotoolbox", "h264_videotoolbox")
+        mocker.patch("main._test_encoder", side_effect=fake_probe())
+        mocker.patch.object(main, "_strict_probe", True)
+        mocker.patch("main.platform.machine", return_value="x86_64")
 
-        _test_gpu_availability()
+        available, encoder, _settings = _test_gpu_availability()
 
-        # Check the order of calls
-        calls = mock_test.call_args_list
-        assert len(calls) == 2
-        assert calls[0][0][0] == "hevc_videotoolbox"
-        assert calls[1][0][0] == "h264_videotoolbox"
+        assert available is False
+        assert encoder is None
+
+    def test_strict_probe_skipped_on_apple_silicon(self, mocker):
+        """On arm64, the listing is trusted even under --strict-probe."""
+        mock_encoder_listing(mocker, "hevc_videotoolbox", "h264_videotoolbox")
+        mock_test = mocker.patch("main._test_encoder")
+        mocker.patch.object(main, "_strict_probe", True)
+        mocker.patch("main.platform.machine", return_value="arm64")
+
+        available, encoder, _settings = _test_gpu_availability()
+
+        assert available is True
+        assert encoder == "hevc_videotoolbox"
+        mock_test.assert_not_called()
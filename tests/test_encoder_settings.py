@@ -1,9 +1,6 @@
 """Tests for encoder settings and filter building functions."""
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
 from main import (
     TARGET_FPS,
@@ -14,13 +11,41 @@ from main import (
     build_portrait_filter,
 )
 
+# Canonical settings per encoder; the parametrized test below checks
+# _get_encoder_settings against these exact dicts.
+EXPECTED_SETTINGS = {
+    "hevc_videotoolbox": {
+        "quality_flag": "-q:v",
+        "quality_values": {"high": "50", "balanced": "60", "fast": "70"},
+        "extra_args": ["-allow_sw", "1"],
+        "input_args": ["-hwaccel", "videotoolbox", "-extra_hw_frames", "8"],
+        "pix_fmt": "yuv420p",
+    },
+    "h264_videotoolbox": {
+        "quality_flag": "-q:v",
+        "quality_values": {"high": "50", "balanced": "60", "fast": "70"},
+        "extra_args": ["-allow_sw", "1"],
+        "input_args": ["-hwaccel", "videotoolbox", "-extra_hw_frames", "8"],
+        "pix_fmt": "yuv420p",
+    },
+    "libx265": {
+        "quality_flag": "-crf",
+        "quality_values": {"high": "20", "balanced": "22", "fast": "24"},
+        "presets": {"high": "slow", "balanced": "medium", "fast": "fast"},
+        "extra_args": [],
+        "input_args": [],
+        "pix_fmt": "yuv420p10le",
+    },
+}
+
 
 class TestGetEncoderSettings:
     """Tests for _get_encoder_settings() function."""
 
-    def test_hevc_videotoolbox_settings(self, hevc_videotoolbox_settings):
-        settings = _get_encoder_settings("hevc_videotoolbox")
-        assert settings == hevc_videotoolbox_settings
+    @pytest.mark.parametrize("encoder", sorted(EXPECTED_SETTINGS))
+    def test_settings_match_expected_table(self, encoder):
+        settings = _get_encoder_settings(encoder)
+        assert settings == EXPECTED_SETTINGS[encoder]
 
     def test_hevc_videotoolbox_quality_flag(self):
         settings = _get_encoder_settings("hevc_videotoolbox")
@@ -31,10 +56,6 @@ class TestGetEncoderSettings:
         assert "-allow_sw" in settings["extra_args"]
         assert "1" in settings["extra_args"]
 
-    def test_h264_videotoolbox_settings(self, h264_videotoolbox_settings):
-        settings = _get_encoder_settings("h264_videotoolbox")
-        assert settings == h264_videotoolbox_settings
-
     def test_h264_videotoolbox_quality_flag(self):
         settings = _get_encoder_settings("h264_videotoolbox")
         assert settings["quality_flag"] == "-q:v"
@@ -43,10 +64,6 @@ class TestGetEncoderSettings:
         settings = _get_encoder_settings("h264_videotoolbox")
         assert settings["pix_fmt"] == "yuv420p"
 
-    def test_libx265_settings(self, libx265_settings):
-        settings = _get_encoder_settings("libx265")
-        assert settings == libx265_settings
-
     def test_libx265_has_crf_flag(self):
         settings = _get_encoder_settings("libx265")
         assert settings["quality_flag"] == "-crf"
@@ -66,6 +83,20 @@ class TestGetEncoderSettings:
         settings = _get_encoder_settings("libx265")
         assert settings["extra_args"] == []
 
+    def test_videotoolbox_encoders_request_hwaccel_decode(self):
+        for encoder in ["hevc_videotoolbox", "h264_videotoolbox"]:
+            settings = _get_encoder_settings(encoder)
+            assert settings["input_args"] == [
+                "-hwaccel",
+                "videotoolbox",
+                "-extra_hw_frames",
+                "8",
+            ]
+
+    def test_libx265_no_input_args(self):
+        settings = _get_encoder_settings("libx265")
+        assert settings["input_args"] == []
+
     def test_unknown_encoder_falls_back_to_libx265(self):
         """Unknown encoders should return libx265 settings (else branch)."""
         settings = _get_encoder_settings("unknown_encoder")
@@ -88,30 +119,41 @@ class TestGetEncoderSettings:
             assert settings["pix_fmt"] is not None
 
 
-class TestBuildPortraitFilter:
-    """Tests for build_portrait_filter() function."""
+@pytest.fixture(scope="module")
+def portrait_filter():
+    """Portrait filter for input 0, built once for the substring checks."""
+    return build_portrait_filter(0)
 
-    def test_filter_contains_split(self):
-        filter_str = build_portrait_filter(0)
-        assert "[0:v]split" in filter_str
 
-    def test_filter_contains_blur(self):
-        filter_str = build_portrait_filter(0)
-        assert "gblur=sigma=50" in filter_str
+@pytest.fixture(scope="module")
+def landscape_filter():
+    """Landscape filter for input 0, built once for the substring checks."""
+    return build_landscape_filter(0)
 
-    def test_filter_contains_overlay(self):
-        filter_str = build_portrait_filter(0)
-        assert "overlay=" in filter_str
 
-    def test_filter_output_label(self):
-        filter_str = build_portrait_filter(0)
-        assert "[v0]" in filter_str
+class TestBuildPortraitFilter:
+    """Tests for build_portrait_filter() function."""
 
-    def test_input_index_0(self):
-        filter_str = build_portrait_filter(0)
-        assert "[0:v]split" in filter_str
-        assert "[0orig]" in filter_str
-        assert "[0copy]" in filter_str
+    @pytest.mark.parametrize(
+        "needle",
+        [
+            "[0:v]split",
+            "[0orig]",
+            "[0copy]",
+            "gblur=sigma=6",
+            # The blur sits between a downscale and an upscale (pyramid)
+            f"scale=iw/8:ih/8,gblur=sigma=6,scale={TARGET_WIDTH}",
+            "overlay=",
+            "[v0]",
+            str(TARGET_WIDTH),
+            str(TARGET_HEIGHT),
+            f"fps={TARGET_FPS}",
+            "setsar=1",
+            "settb=AVTB",
+        ],
+    )
+    def test_filter_contains(self, portrait_filter, needle):
+        assert needle in portrait_filter
 
     def test_input_index_5(self):
         filter_str = build_portrait_filter(5)
@@ -126,32 +168,9 @@ class TestBuildPortraitFilter:
         assert "[10orig]" in filter_str
         assert "[v10]" in filter_str
 
-    def test_target_width_in_filter(self):
-        filter_str = build_portrait_filter(0)
-        assert str(TARGET_WIDTH) in filter_str
-
-    def test_target_height_in_filter(self):
-        filter_str = build_portrait_filter(0)
-        assert str(TARGET_HEIGHT) in filter_str
-
-    def test_fps_in_filter(self):
-        filter_str = build_portrait_filter(0)
-        assert f"fps={TARGET_FPS}" in filter_str
-
-    def test_setsar_in_filter(self):
-        """Verify sample aspect ratio is set to 1."""
-        filter_str = build_portrait_filter(0)
-        assert "setsar=1" in filter_str
-
-    def test_settb_in_filter(self):
-        """Verify timebase is set."""
-        filter_str = build_portrait_filter(0)
-        assert "settb=AVTB" in filter_str
-
-    def test_no_rotation_by_default(self):
+    def test_no_rotation_by_default(self, portrait_filter):
         """Filter should not include transpose when rotation is 0."""
-        filter_str = build_portrait_filter(0)
-        assert "transpose" not in filter_str
+        assert "transpose" not in portrait_filter
 
     def test_rotation_90_degrees(self):
         """Filter should include transpose=1 for 90 degree rotation."""
@@ -159,9 +178,9 @@ class TestBuildPortraitFilter:
         assert "transpose=1" in filter_str
 
     def test_rotation_180_degrees(self):
-        """Filter should include double transpose for 180 degree rotation."""
+        """Filter should use hflip,vflip for 180 degree rotation."""
         filter_str = build_portrait_filter(0, rotation=180)
-        assert "transpose=1,transpose=1" in filter_str
+        assert "hflip,vflip" in filter_str
 
     def test_rotation_270_degrees(self):
         """Filter should include transpose=2 for 270 degree rotation."""
@@ -179,17 +198,23 @@ class TestBuildPortraitFilter:
 class TestBuildLandscapeFilter:
     """Tests for build_landscape_filter() function."""
 
-    def test_filter_contains_scale(self):
-        filter_str = build_landscape_filter(0)
-        assert "[0:v]scale=" in filter_str
-
-    def test_filter_contains_pad(self):
-        filter_str = build_landscape_filter(0)
-        assert "pad=" in filter_str
-
-    def test_filter_output_label(self):
-        filter_str = build_landscape_filter(0)
-        assert "[v0]" in filter_str
+    @pytest.mark.parametrize(
+        "needle",
+        [
+            "[0:v]scale=",
+            "pad=",
+            ":black",
+            "force_original_aspect_ratio=decrease",
+            "[v0]",
+            str(TARGET_WIDTH),
+            str(TARGET_HEIGHT),
+            f"fps={TARGET_FPS}",
+            "setsar=1",
+            "settb=AVTB",
+        ],
+    )
+    def test_filter_contains(self, landscape_filter, needle):
+        assert needle in landscape_filter
 
     def test_input_index_3(self):
         filter_str = build_landscape_filter(3)
@@ -201,40 +226,9 @@ class TestBuildLandscapeFilter:
         assert "[7:v]scale=" in filter_str
         assert "[v7]" in filter_str
 
-    def test_target_width_in_filter(self):
-        filter_str = build_landscape_filter(0)
-        assert str(TARGET_WIDTH) in filter_str
-
-    def test_target_height_in_filter(self):
-        filter_str = build_landscape_filter(0)
-        assert str(TARGET_HEIGHT) in filter_str
-
-    def test_black_padding(self):
-        filter_str = build_landscape_filter(0)
-        assert ":black" in filter_str
-
-    def test_fps_in_filter(self):
-        filter_str = build_landscape_filter(0)
-        assert f"fps={TARGET_FPS}" in filter_str
-
-    def test_setsar_in_filter(self):
-        """Verify sample aspect ratio is set to 1."""
-        filter_str = build_landscape_filter(0)
-        assert "setsar=1" in filter_str
-
-    def test_force_original_aspect_ratio(self):
-        filter_str = build_landscape_filter(0)
-        assert "force_original_aspect_ratio=decrease" in filter_str
-
-    def test_settb_in_filter(self):
-        """Verify timebase is set."""
-        filter_str = build_landscape_filter(0)
-        assert "settb=AVTB" in filter_str
-
-    def test_no_rotation_by_default(self):
+    def test_no_rotation_by_default(self, landscape_filter):
         """Filter should not include transpose when rotation is 0."""
-        filter_str = build_landscape_filter(0)
-        assert "transpose" not in filter_str
+        assert "transpose" not in landscape_filter
 
     def test_rotation_90_degrees(self):
         """Filter should include transpose=1 for 90 degree rotation."""
@@ -242,9 +236,9 @@ class TestBuildLandscapeFilter:
         assert "transpose=1" in filter_str
 
     def test_rotation_180_degrees(self):
-        """Filter should include double transpose for 180 degree rotation."""
+        """Filter should use hflip,vflip for 180 degree rotation."""
         filter_str = build_landscape_filter(0, rotation=180)
-        assert "transpose=1,transpose=1" in filter_str
+        assert "hflip,vflip" in filter_str
 
     def test_rotation_270_degrees(self):
         """Filter should include transpose=2 for 270 degree rotation."""
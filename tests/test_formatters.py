@@ -1,14 +1,16 @@
 """Tests for pure utility/formatter functions."""
 
-import sys
 from datetime import datetime
-from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from main import format_duration, format_size, generate_output_filename, validate_date
+from main import (
+    format_duration,
+    format_size,
+    generate_output_filename,
+    validate_date,
+    validate_optional_number,
+)
 
 
 class TestFormatSize:
@@ -69,6 +71,15 @@ class TestFormatSize:
         assert format_size(1024 * 1023) == "1023.0 KB"
         assert format_size(1024 * 1024) == "1.0 MB"
 
+    def test_boundary_gb(self):
+        """Test boundary between MB and GB."""
+        assert format_size(1024**3 - 1) == "1024.0 MB"
+        assert format_size(1024**3) == "1.0 GB"
+
+    def test_beyond_terabytes_stays_in_tb(self):
+        """Sizes past 1024 TB should still render in TB, the largest unit."""
+        assert format_size(1024**5) == "1024.0 TB"
+
 
 class TestFormatDuration:
     """Tests for format_duration() function."""
@@ -182,6 +193,29 @@ class TestValidateDate:
         assert validate_date("  ") is False
 
 
+class TestValidateOptionalNumber:
+    """Tests for validate_optional_number() function."""
+
+    def test_empty_string_is_valid(self):
+        """Empty input means 'no filter' and is accepted."""
+        assert validate_optional_number("") is True
+
+    def test_integer_is_valid(self):
+        assert validate_optional_number("30") is True
+
+    def test_float_is_valid(self):
+        assert validate_optional_number("2.5") is True
+
+    def test_letters_are_invalid(self):
+        assert validate_optional_number("abc") is False
+
+    def test_negative_is_invalid(self):
+        assert validate_optional_number("-5") is False
+
+    def test_trailing_dot_is_invalid(self):
+        assert validate_optional_number("5.") is False
+
+
 class TestGenerateOutputFilename:
     """Tests for generate_output_filename() function."""
 
@@ -1,13 +1,9 @@
 """Tests for interactive prompt functions with questionary mocking."""
 
-import sys
 from datetime import datetime
-from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from main import (
     EncodingSelection,
     _get_encoder_settings,
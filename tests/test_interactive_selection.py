@@ -1,9 +1,18 @@
 """Tests for interactive video selection feature."""
 
+import json
+import os
+import pty
 import socket
+import termios
+import threading
+import time
 from datetime import datetime
 from unittest.mock import MagicMock
 
+import pytest
+
+import main
 from main import (
     SelectionState,
     VideoDecision,
@@ -89,6 +98,41 @@ class TestSelectionState:
 
         assert state.skipped_count == 2
 
+    def test_set_decision_updates_counters(self, mock_video_list):
+        """set_decision should keep the cached counters in sync."""
+        decisions = [VideoDecision(video=v) for v in mock_video_list]
+        state = SelectionState(decisions=decisions)
+
+        state.set_decision(0, "keep")
+        state.set_decision(1, "skip")
+
+        assert state.kept_count == 1
+        assert state.skipped_count == 1
+        assert decisions[0].decision == "keep"
+        assert decisions[1].decision == "skip"
+
+    def test_set_decision_undo_to_pending(self, mock_video_list):
+        """Reverting a decision to pending should decrement its bucket."""
+        decisions = [VideoDecision(video=v) for v in mock_video_list]
+        state = SelectionState(decisions=decisions)
+
+        state.set_decision(0, "keep")
+        state.set_decision(0, "pending")
+
+        assert state.kept_count == 0
+        assert state.skipped_count == 0
+
+    def test_set_decision_change_buckets(self, mock_video_list):
+        """Changing keep to skip should move the count between buckets."""
+        decisions = [VideoDecision(video=v) for v in mock_video_list]
+        state = SelectionState(decisions=decisions)
+
+        state.set_decision(0, "keep")
+        state.set_decision(0, "skip")
+
+        assert state.kept_count == 0
+        assert state.skipped_count == 1
+
     def test_current_video(self, mock_video_list):
         """current_video should return the decision at current_index."""
         decisions = [VideoDecision(video=v) for v in mock_video_list]
@@ -123,6 +167,13 @@ class TestSelectionState:
 class TestCheckMpvAvailable:
     """Tests for _check_mpv_available function."""
 
+    @pytest.fixture(autouse=True)
+    def clear_mpv_path_cache(self):
+        """Reset the cached mpv lookup so shutil.which mocks take effect."""
+        main._mpv_path.cache_clear()
+        yield
+        main._mpv_path.cache_clear()
+
     def test_returns_false_when_mpv_not_installed(self, mocker, mock_console):
         """Should return False when mpv binary is not found."""
         mocker.patch("shutil.which", return_value=None)
@@ -198,6 +249,56 @@ class TestSendMpvCommand:
 
         mock_socket_class.assert_called_with(socket.AF_UNIX, socket.SOCK_STREAM)
 
+    def test_batch_sends_commands_in_one_write(self, mocker):
+        """_send_mpv_commands should join commands into a single send."""
+        import json
+
+        mock_socket = MagicMock()
+        mocker.patch("socket.socket", return_value=mock_socket)
+
+        main._send_mpv_commands(
+            [["playlist-next", "force"], ["loadfile", "/next.mov", "append"]]
+        )
+
+        call_args = mock_socket.send.call_args[0][0]
+        lines = call_args.decode().strip().split("\n")
+        assert len(lines) == 2
+        assert json.loads(lines[0])["command"] == ["playlist-next", "force"]
+        assert json.loads(lines[1])["command"] == [
+            "loadfile",
+            "/next.mov",
+            "append",
+        ]
+        mock_socket.send.assert_called_once()
+
+    def test_reuses_persistent_session_socket(self, mocker):
+        """With a session socket connected, no new socket is created."""
+        mock_sock = MagicMock()
+        mocker.patch.object(main, "_mpv_sock", mock_sock)
+        mock_socket_class = mocker.patch("socket.socket")
+
+        result = _send_mpv_command(["loadfile", "/path/to/video.mov"])
+
+        assert result is True
+        mock_sock.sendall.assert_called_once()
+        mock_socket_class.assert_not_called()
+
+    def test_reconnects_once_on_broken_pipe(self, mocker):
+        """A dead session socket triggers a single reconnect and resend."""
+        dead_sock = MagicMock()
+        dead_sock.sendall.side_effect = BrokenPipeError()
+        mocker.patch.object(main, "_mpv_sock", dead_sock)
+
+        fresh_sock = MagicMock()
+        mocker.patch("socket.socket", return_value=fresh_sock)
+
+        result = _send_mpv_command(["loadfile", "/path/to/video.mov"])
+
+        assert result is True
+        fresh_sock.sendall.assert_called_once()
+        # Clean up the reconnected session socket for test isolation
+        main._mpv_sock = None
+
 
 class TestDisplayVideoMetadata:
     """Tests for _display_video_metadata function."""
@@ -319,9 +420,11 @@ class TestInteractiveVideoSelection:
 
         assert len(result) == 2
 
-    def test_sorts_videos_by_date(self, mocker, mock_console):
-        """Videos should be sorted by date for chronological review."""
-        # Create videos in random order
+    def test_mpv_fallback_keeps_all_videos_in_input_order(self, mocker, mock_console):
+        """Without mpv, selection returns every video in the order given.
+
+        The caller already sorted by date; selection must not re-sort.
+        """
         videos = [
             create_mock_video(
                 uuid="last", date=datetime(2024, 6, 17), path="/last.mov"
@@ -334,13 +437,11 @@ class TestInteractiveVideoSelection:
             ),
         ]
 
-        # Mock mpv as unavailable to test sorting logic indirectly
         mocker.patch("main._check_mpv_available", return_value=False)
 
         result, _rotation_map = interactive_video_selection(videos)
 
-        # All should be returned (fallback mode)
-        assert len(result) == 3
+        assert [v.uuid for v in result] == ["last", "first", "middle"]
 
 
 class TestSelectionStateEdgeCases:
@@ -391,3 +492,188 @@ class TestSelectionStateEdgeCases:
         assert state.skipped_count == 1
         pending = state.total_count - state.kept_count - state.skipped_count
         assert pending == 3
+
+
+class TestPromptDecision:
+    """Tests for the raw-keypress decision prompt."""
+
+    def _fake_tty(self, mocker, keys, pending=True):
+        """Simulate cbreak-mode os.read() calls yielding `keys` byte by byte.
+
+        Each key is split into single bytes, matching what os.read(fd, 1)
+        delivers on a real descriptor; an empty key becomes an EOF read.
+        `pending` controls whether the select() poll after an Escape byte
+        reports follow-up bytes as available.
+        """
+        mocker.patch("main.termios.tcgetattr", return_value="old-attrs")
+        mocker.patch("main.termios.tcsetattr")
+        mocker.patch("main.tty.setcbreak")
+        mocker.patch(
+            "main.select.select", return_value=([0] if pending else [], [], [])
+        )
+        stdin = MagicMock()
+        stdin.fileno.return_value = 0
+        mocker.patch.object(main.sys, "stdin", stdin)
+        reads = []
+        for key in keys:
+            if key:
+                reads.extend(ch.encode() for ch in key)
+            else:
+                reads.append(b"")
+        mocker.patch("main.os.read", side_effect=reads)
+
+    def test_digit_keys_map_to_decisions(self, mocker):
+        self._fake_tty(mocker, ["1"])
+        assert main._read_decision_key() == "keep"
+
+        self._fake_tty(mocker, ["2"])
+        assert main._read_decision_key() == "skip"
+
+    def test_arrow_key_escape_sequence(self, mocker):
+        """Right arrow arrives as ESC plus two bytes and means keep."""
+        self._fake_tty(mocker, ["\x1b[C"])
+        assert main._read_decision_key() == "keep"
+
+    def test_arrow_key_through_a_pty(self, mocker):
+        """An arrow press on a real pty must register as one decision.
+
+        Regression test: reading through the buffered sys.stdin pulled the
+        whole escape sequence into Python's buffer, so the select() poll on
+        the raw fd saw nothing pending and the arrow degraded to a bare
+        Escape.
+        """
+        master, slave = pty.openpty()
+
+        def write_arrow():
+            # setcbreak flushes pending input (TCSAFLUSH), so wait until the
+            # reader has switched the pty out of canonical mode before typing
+            while termios.tcgetattr(slave)[3] & termios.ICANON:
+                time.sleep(0.005)
+            os.write(master, b"\x1b[D")
+
+        writer = threading.Thread(target=write_arrow)
+        try:
+            stdin = MagicMock()
+            stdin.fileno.return_value = slave
+            mocker.patch.object(main.sys, "stdin", stdin)
+            writer.start()
+            assert main._read_decision_key() == "skip"
+        finally:
+            writer.join()
+            os.close(master)
+            os.close(slave)
+
+    def test_unmapped_keys_are_ignored(self, mocker):
+        self._fake_tty(mocker, ["x", "z", "q"])
+        assert main._read_decision_key() == "quit"
+
+    def test_eof_means_quit(self, mocker):
+        """A hung-up stdin must end the session instead of spinning."""
+        self._fake_tty(mocker, [""])
+        assert main._read_decision_key() == "quit"
+
+    def test_bare_escape_is_ignored(self, mocker):
+        """Escape with no pending follow-up bytes is not a decision key."""
+        self._fake_tty(mocker, ["\x1b", "1"], pending=False)
+        assert main._read_decision_key() == "keep"
+
+    def test_terminal_attrs_restored(self, mocker):
+        self._fake_tty(mocker, ["r"])
+        main._read_decision_key()
+
+        main.termios.tcsetattr.assert_called_once()
+        assert main.termios.tcsetattr.call_args[0][2] == "old-attrs"
+
+    def test_falls_back_to_questionary_without_tty(self, mocker):
+        """Non-TTY stdin (tests, pipes) should use the questionary menu."""
+        mocker.patch("main.termios.tcgetattr", side_effect=main.termios.error)
+        mock_select = mocker.patch("main.questionary.select")
+        mock_select.return_value.ask.return_value = "skip"
+
+        assert main._prompt_decision() == "skip"
+        mock_select.assert_called_once()
+
+
+class TestWarmVideoMetadata:
+    """Tests for the background metadata warmer."""
+
+    def test_touches_lazy_properties(self):
+        """Warming should read the properties the display panel needs."""
+        video = create_mock_video(uuid="warm-1")
+
+        main._warm_video_metadata(video)
+
+        assert video.uuid in {"warm-1"}  # no exception, video untouched
+        assert main._video_duration(video) == video.exif_info.duration
+
+    def test_swallows_property_errors(self):
+        """A failing Photos database read must not propagate."""
+
+        class BrokenVideo:
+            uuid = "warm-2"
+            original_filesize = 0
+            original_filename = "broken.mov"
+            width = 1920
+            height = 1080
+            exif_info = None
+            place = None
+
+            @property
+            def persons(self):
+                raise RuntimeError("db gone")
+
+        main._warm_video_metadata(BrokenVideo())
+
+
+class TestSendMpvRotate:
+    """Tests for the pre-encoded rotate command."""
+
+    def test_template_matches_json_protocol(self, mocker):
+        """The template must produce the same wire format as json.dumps."""
+        mock_payload = mocker.patch("main._send_mpv_payload", return_value=True)
+
+        main._send_mpv_rotate(270)
+
+        sent = mock_payload.call_args[0][0]
+        expected = (
+            json.dumps({"command": ["set_property", "video-rotate", "270"]}) + "\n"
+        ).encode()
+        assert json.loads(sent) == json.loads(expected)
+        assert sent.endswith(b"\n")
+
+
+class TestConnectMpvSocket:
+    """Tests for the polling socket connect."""
+
+    def test_connects_immediately_when_socket_ready(self, mocker):
+        mock_sock = MagicMock()
+        mocker.patch("main.socket.socket", return_value=mock_sock)
+        mock_sleep = mocker.patch("main.time.sleep")
+
+        assert main._connect_mpv_socket() is True
+        assert main._mpv_sock is mock_sock
+        mock_sleep.assert_not_called()
+
+        main._mpv_sock = None
+
+    def test_polls_until_socket_appears(self, mocker):
+        """Connect retries on OSError until mpv creates the socket."""
+        mock_sock = MagicMock()
+        mock_sock.connect.side_effect = [OSError, OSError, None]
+        mocker.patch("main.socket.socket", return_value=mock_sock)
+        mocker.patch("main.time.sleep")
+        mocker.patch("main.time.monotonic", side_effect=[0.0, 0.01, 0.02])
+
+        assert main._connect_mpv_socket(timeout=1.0) is True
+
+        main._mpv_sock = None
+
+    def test_gives_up_after_timeout(self, mocker):
+        mock_sock = MagicMock()
+        mock_sock.connect.side_effect = OSError
+        mocker.patch("main.socket.socket", return_value=mock_sock)
+        mocker.patch("main.time.sleep")
+        mocker.patch("main.time.monotonic", side_effect=[0.0, 0.5, 1.5])
+
+        assert main._connect_mpv_socket(timeout=1.0) is False
+        assert main._mpv_sock is None
@@ -1,22 +1,22 @@
 """Integration tests for main() workflow function."""
 
-import os
-import sys
+import json
 from datetime import datetime
 from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-sys.path.insert(0, os.path.dirname(__file__))
-
-
 from main import main
 
 
 class TestMainWorkflow:
     """Integration tests for main() function."""
 
+    @pytest.fixture(autouse=True)
+    def no_db_prefetch(self, mocker):
+        """Keep main() from loading a real PhotosDB in the background."""
+        mocker.patch("main._start_photosdb_load")
+
     def test_full_interactive_workflow(
         self, mocker, mock_console, tmp_path, mock_video_list
     ):
@@ -275,3 +275,69 @@ class TestMainRecompileMode:
         # Playlist should still exist with same content
         assert sample_playlist.exists()
         assert sample_playlist.read_text() == original_content
+
+    def test_recompile_replays_cached_command(
+        self, mocker, mock_console, sample_playlist
+    ):
+        """A recorded last_cmd replays directly, skipping the prompts."""
+        playlist = json.loads(sample_playlist.read_text())
+        playlist["last_cmd"] = ["ffmpeg", "-y", "-i", "in.mov", "out.mp4"]
+        sample_playlist.write_text(json.dumps(playlist))
+
+        mocker.patch("sys.argv", ["main.py", "--recompile", str(sample_playlist)])
+        mock_confirm = mocker.patch("main.questionary.confirm")
+        mock_confirm.return_value.ask.return_value = True
+        mock_quality = mocker.patch("main.prompt_quality_selection")
+        mock_run = mocker.patch("main._run_ffmpeg_with_progress")
+
+        main()
+
+        mock_quality.assert_not_called()
+        assert mock_run.call_args[0][0] == playlist["last_cmd"]
+
+    def test_recompile_replay_reports_recorded_primary_output(
+        self, mocker, mock_console, sample_playlist
+    ):
+        """Replay must use last_output, not the command's final argument.
+
+        With --renditions the command ends with the last rendition's path,
+        so indexing cmd[-1] would report the wrong file.
+        """
+        playlist = json.loads(sample_playlist.read_text())
+        playlist["last_cmd"] = [
+            "ffmpeg",
+            "-y",
+            "-i",
+            "in.mov",
+            "out.mp4",
+            "out_720p.mp4",
+        ]
+        playlist["last_output"] = "out.mp4"
+        sample_playlist.write_text(json.dumps(playlist))
+
+        mocker.patch("sys.argv", ["main.py", "--recompile", str(sample_playlist)])
+        mock_confirm = mocker.patch("main.questionary.confirm")
+        mock_confirm.return_value.ask.return_value = True
+        mock_run = mocker.patch("main._run_ffmpeg_with_progress")
+
+        main()
+
+        assert mock_run.call_args[0][2] == Path("out.mp4")
+
+    def test_recompile_declined_replay_falls_back_to_prompts(
+        self, mocker, mock_console, sample_playlist
+    ):
+        """Declining the replay goes through quality selection as before."""
+        playlist = json.loads(sample_playlist.read_text())
+        playlist["last_cmd"] = ["ffmpeg", "-y", "-i", "in.mov", "out.mp4"]
+        sample_playlist.write_text(json.dumps(playlist))
+
+        mocker.patch("sys.argv", ["main.py", "--recompile", str(sample_playlist)])
+        mock_confirm = mocker.patch("main.questionary.confirm")
+        mock_confirm.return_value.ask.return_value = False
+        mocker.patch("main.prompt_quality_selection", return_value=None)
+        mock_compile = mocker.patch("main.compile_movie")
+
+        main()
+
+        mock_compile.assert_called_once()
@@ -1,17 +1,11 @@
 """Tests for Photos library integration functions with osxphotos mocking."""
 
-import os
-import sys
 from datetime import datetime
-from pathlib import Path
 from unittest.mock import MagicMock
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-sys.path.insert(0, os.path.dirname(__file__))
-
 from conftest import create_mock_video
 
-from main import export_videos, query_videos
+from main import _prefetch_missing, export_videos, query_videos
 
 
 class TestQueryVideos:
@@ -29,7 +23,7 @@ class TestQueryVideos:
         query_videos(start, end)
 
         mock_photosdb.photos.assert_called_once_with(
-            movies=True, images=False, from_date=start, to_date=end
+            movies=True, images=False, from_date=start, to_date=end, intrash=False
         )
 
     def test_returns_videos_from_photos_library(
@@ -47,26 +41,16 @@ class TestQueryVideos:
 
         assert len(videos) == len(mock_video_list)
 
-    def test_filters_trashed_videos(self, mocker, mock_console):
-        """Test that trashed videos are excluded from results."""
-        videos = [
-            create_mock_video(uuid="v1", intrash=False),
-            create_mock_video(uuid="v2", intrash=True),  # Should be excluded
-            create_mock_video(uuid="v3", intrash=False),
-        ]
-
+    def test_filters_trashed_videos_in_query(self, mocker, mock_console):
+        """Test that trashed videos are excluded at the query level."""
         mock_photosdb = MagicMock()
-        mock_photosdb.photos.return_value = videos
+        mock_photosdb.photos.return_value = []
         mocker.patch("main.osxphotos.PhotosDB", return_value=mock_photosdb)
 
-        result = query_videos(datetime(2024, 1, 1), datetime(2024, 12, 31))
+        query_videos(datetime(2024, 1, 1), datetime(2024, 12, 31))
 
-        assert len(result) == 2
-        assert all(not v.intrash for v in result)
-        uuids = [v.uuid for v in result]
-        assert "v1" in uuids
-        assert "v2" not in uuids
-        assert "v3" in uuids
+        # The trash filter is pushed into osxphotos instead of a Python loop
+        assert mock_photosdb.photos.call_args.kwargs["intrash"] is False
 
     def test_returns_empty_for_no_videos(self, mocker, mock_console):
         """Test behavior when no videos are found."""
@@ -79,14 +63,9 @@ class TestQueryVideos:
         assert result == []
 
     def test_all_trashed_returns_empty(self, mocker, mock_console):
-        """Test when all videos are in trash."""
-        videos = [
-            create_mock_video(uuid="v1", intrash=True),
-            create_mock_video(uuid="v2", intrash=True),
-        ]
-
+        """Test when all videos are in trash (osxphotos returns nothing)."""
         mock_photosdb = MagicMock()
-        mock_photosdb.photos.return_value = videos
+        mock_photosdb.photos.return_value = []
         mocker.patch("main.osxphotos.PhotosDB", return_value=mock_photosdb)
 
         result = query_videos(datetime(2024, 1, 1), datetime(2024, 12, 31))
@@ -194,8 +173,14 @@ class TestExportVideos:
         assert "uuid-1" in result
         assert "uuid-2" in result
 
-    def test_videos_sorted_by_date_before_export(self, mocker, mock_console, tmp_path):
-        """Test that videos are sorted by date before exporting."""
+    def test_exports_all_videos_regardless_of_order(
+        self, mocker, mock_console, tmp_path
+    ):
+        """All videos export even when given out of date order.
+
+        Exports run concurrently, so completion order is not guaranteed;
+        only the result mapping matters (create_playlist sorts by date).
+        """
         video1 = create_mock_video(uuid="uuid-1", date=datetime(2024, 6, 20))
         video2 = create_mock_video(uuid="uuid-2", date=datetime(2024, 6, 10))
         videos = [video1, video2]  # Out of order
@@ -209,22 +194,94 @@ class TestExportVideos:
         mock_progress.__exit__ = MagicMock(return_value=False)
         mocker.patch("main.Progress", return_value=mock_progress)
 
-        export_order = []
+        for i, video in enumerate(videos):
+            exported_file = tmp_path / f"video{i}.mov"
+            exported_file.write_bytes(b"data")
+            video.export.return_value = [str(exported_file)]
+
+        result = export_videos(videos)
+
+        assert set(result) == {"uuid-1", "uuid-2"}
+        video1.export.assert_called_once()
+        video2.export.assert_called_once()
+
+
+class TestPrefetchMissing:
+    """Tests for _prefetch_missing() function."""
 
-        # Set up side effects to track export order
-        def make_export_tracker(uuid):
-            def track_export(*a, **k):
-                export_order.append(uuid)
-                return []
+    def _mock_progress(self, mocker):
+        """Mock Progress to avoid Rich internals issues with MagicMock."""
+        mock_progress = MagicMock()
+        mock_progress.__enter__ = MagicMock(return_value=mock_progress)
+        mock_progress.__exit__ = MagicMock(return_value=False)
+        mocker.patch("main.Progress", return_value=mock_progress)
 
-            return track_export
+    def test_no_missing_videos_is_noop(self, mocker, mock_console, tmp_path):
+        """Nothing should be downloaded when all videos are local."""
+        video = create_mock_video(uuid="local", ismissing=False)
+
+        videos_dir = tmp_path / "videos"
+        mocker.patch("main.VIDEOS_DIR", videos_dir)
 
-        video1.export.side_effect = make_export_tracker("uuid-1")
-        video2.export.side_effect = make_export_tracker("uuid-2")
+        _prefetch_missing([video])
+
+        video.export.assert_not_called()
+        assert not videos_dir.exists()
+
+    def test_downloads_missing_videos(self, mocker, mock_console, tmp_path):
+        """Missing videos are exported into the cache under their UUID."""
+        video = create_mock_video(uuid="cloud-uuid", ismissing=True)
+        exported_file = tmp_path / "downloaded.mov"
+        exported_file.write_bytes(b"icloud data")
+        video.export.return_value = [str(exported_file)]
+
+        videos_dir = tmp_path / "videos"
+        mocker.patch("main.VIDEOS_DIR", videos_dir)
+        self._mock_progress(mocker)
+
+        _prefetch_missing([video])
+
+        video.export.assert_called_once()
+        assert (videos_dir / "cloud-uuid.mov").exists()
+
+    def test_skips_already_cached_videos(self, mocker, mock_console, tmp_path):
+        """Cached videos should not be downloaded again."""
+        video = create_mock_video(uuid="cached-uuid", ismissing=True)
+
+        videos_dir = tmp_path / "videos"
+        videos_dir.mkdir()
+        (videos_dir / "cached-uuid.mov").write_bytes(b"already cached")
+
+        mocker.patch("main.VIDEOS_DIR", videos_dir)
+        self._mock_progress(mocker)
+
+        _prefetch_missing([video])
+
+        video.export.assert_not_called()
+
+    def test_handles_download_failure(self, mocker, mock_console, tmp_path):
+        """Failed downloads should not raise."""
+        video = create_mock_video(uuid="fail-uuid", ismissing=True)
+        video.export.side_effect = Exception("Download error")
+
+        mocker.patch("main.VIDEOS_DIR", tmp_path / "videos")
+        self._mock_progress(mocker)
+
+        _prefetch_missing([video])
+
+    def test_downloads_only_missing_videos(self, mocker, mock_console, tmp_path):
+        """Local videos are left alone while missing ones are fetched."""
+        local = create_mock_video(uuid="local", ismissing=False)
+        cloud = create_mock_video(uuid="cloud", ismissing=True)
+        exported_file = tmp_path / "cloud.mov"
+        exported_file.write_bytes(b"data")
+        cloud.export.return_value = [str(exported_file)]
+
+        videos_dir = tmp_path / "videos"
+        mocker.patch("main.VIDEOS_DIR", videos_dir)
+        self._mock_progress(mocker)
 
-        export_videos(videos)
+        _prefetch_missing([local, cloud])
 
-        # Should be sorted by date, so uuid-2 (earlier date) should be first
-        if len(export_order) >= 2:
-            assert export_order[0] == "uuid-2"
-            assert export_order[1] == "uuid-1"
+        local.export.assert_not_called()
+        cloud.export.assert_called_once()
@@ -1,14 +1,10 @@
 """Tests for playlist creation functions."""
 
 import json
-import sys
 from datetime import datetime
-from pathlib import Path
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from main import create_playlist
 from tests.conftest import create_mock_video
 
@@ -1,14 +1,9 @@
 """Tests for project management functions (playlist creation, display)."""
 
 import json
-import os
-import sys
 from datetime import datetime
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-sys.path.insert(0, os.path.dirname(__file__))
-
 from conftest import create_mock_video
 
 from main import create_playlist, display_video_summary
@@ -1,24 +1,31 @@
 """Tests for video compilation functions with subprocess mocking."""
 
 import json
-import sys
+import subprocess
 from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from main import EncodingSelection, _encoder_cache, _get_encoder_settings, compile_movie
+from main import (
+    EncodingSelection,
+    _clips_are_uniform,
+    _encoder_cache,
+    _get_encoder_settings,
+    compile_movie,
+)
 
 
 class TestCompileMovie:
     """Tests for compile_movie() function."""
 
     @pytest.fixture(autouse=True)
-    def clear_encoder_cache(self):
-        """Clear encoder cache before each test."""
+    def clear_encoder_cache(self, mocker):
+        """Clear encoder cache, disable the on-disk cache, stub hwaccels."""
         _encoder_cache.clear()
+        mocker.patch("main._load_encoder_cache")
+        mocker.patch("main._save_encoder_cache")
+        mocker.patch("main._list_ffmpeg_hwaccels", return_value={"videotoolbox"})
         yield
         _encoder_cache.clear()
 
@@ -64,7 +71,10 @@ class TestCompileMovie:
 
     def test_builds_ffmpeg_command(self, mocker, mock_console, sample_playlist):
         """Test that ffmpeg command is built correctly."""
-        mocker.patch("main._test_encoder", return_value=True)
+        mocker.patch(
+            "main._list_ffmpeg_encoders",
+            return_value={"hevc_videotoolbox", "h264_videotoolbox"},
+        )
 
         mock_popen = MagicMock()
         mock_popen.stdout = iter([])
@@ -101,6 +111,60 @@ class TestCompileMovie:
         encoder_idx = cmd.index("-c:v") + 1
         assert cmd[encoder_idx] == "hevc_videotoolbox"
 
+    def test_gpu_encoding_uses_hwaccel_decode(
+        self, mocker, mock_console, sample_playlist, gpu_encoding_balanced
+    ):
+        """GPU encodes also decode via VideoToolbox, ahead of each input."""
+        mock_popen = MagicMock()
+        mock_popen.stdout = iter([])
+        mock_popen.wait.return_value = None
+        mock_popen.returncode = 0
+        mocker.patch("main.subprocess.Popen", return_value=mock_popen)
+
+        compile_movie(sample_playlist, gpu_encoding_balanced)
+
+        import main
+
+        cmd = main.subprocess.Popen.call_args[0][0]
+        hwaccel_idx = cmd.index("-hwaccel")
+        assert cmd[hwaccel_idx + 1] == "videotoolbox"
+        assert hwaccel_idx < cmd.index("-i")
+
+    def test_hwaccel_dropped_when_unsupported(
+        self, mocker, mock_console, sample_playlist, gpu_encoding_balanced
+    ):
+        """No -hwaccel flag when the local ffmpeg lacks videotoolbox."""
+        mocker.patch("main._list_ffmpeg_hwaccels", return_value=set())
+        mock_popen = MagicMock()
+        mock_popen.stdout = iter([])
+        mock_popen.wait.return_value = None
+        mock_popen.returncode = 0
+        mocker.patch("main.subprocess.Popen", return_value=mock_popen)
+
+        compile_movie(sample_playlist, gpu_encoding_balanced)
+
+        import main
+
+        cmd = main.subprocess.Popen.call_args[0][0]
+        assert "-hwaccel" not in cmd
+
+    def test_cpu_encoding_no_hwaccel_decode(
+        self, mocker, mock_console, sample_playlist, cpu_encoding_balanced
+    ):
+        """CPU encodes keep software decode (10-bit pipeline)."""
+        mock_popen = MagicMock()
+        mock_popen.stdout = iter([])
+        mock_popen.wait.return_value = None
+        mock_popen.returncode = 0
+        mocker.patch("main.subprocess.Popen", return_value=mock_popen)
+
+        compile_movie(sample_playlist, cpu_encoding_balanced)
+
+        import main
+
+        cmd = main.subprocess.Popen.call_args[0][0]
+        assert "-hwaccel" not in cmd
+
     def test_uses_libx265_for_cpu_quality(
         self, mocker, mock_console, sample_playlist, cpu_encoding_high
     ):
@@ -141,7 +205,10 @@ class TestCompileMovie:
 
     def test_ffmpeg_not_found_returns_none(self, mocker, mock_console, sample_playlist):
         """Test handling when ffmpeg is not installed."""
-        mocker.patch("main._test_encoder", return_value=True)
+        mocker.patch(
+            "main._list_ffmpeg_encoders",
+            return_value={"hevc_videotoolbox", "h264_videotoolbox"},
+        )
         mocker.patch("main.subprocess.Popen", side_effect=FileNotFoundError())
 
         result = compile_movie(sample_playlist)
@@ -150,7 +217,10 @@ class TestCompileMovie:
 
     def test_ffmpeg_failure_returns_none(self, mocker, mock_console, sample_playlist):
         """Test handling when ffmpeg fails."""
-        mocker.patch("main._test_encoder", return_value=True)
+        mocker.patch(
+            "main._list_ffmpeg_encoders",
+            return_value={"hevc_videotoolbox", "h264_videotoolbox"},
+        )
 
         mock_popen = MagicMock()
         mock_popen.stdout = iter([])
@@ -162,9 +232,31 @@ class TestCompileMovie:
 
         assert result is None
 
+    def test_uses_progress_pipe_stream(
+        self, mocker, mock_console, sample_playlist, cpu_encoding_balanced
+    ):
+        """ffmpeg should emit the key=value progress stream on stdout."""
+        mock_popen = MagicMock()
+        mock_popen.stdout = iter([])
+        mock_popen.wait.return_value = None
+        mock_popen.returncode = 0
+        mocker.patch("main.subprocess.Popen", return_value=mock_popen)
+
+        compile_movie(sample_playlist, cpu_encoding_balanced)
+
+        import main
+
+        cmd = main.subprocess.Popen.call_args[0][0]
+        progress_idx = cmd.index("-progress")
+        assert cmd[progress_idx + 1] == "pipe:1"
+        assert "-nostats" in cmd
+
     def test_portrait_video_uses_blur_filter(self, mocker, mock_console, tmp_path):
         """Test that portrait videos use blur filter."""
-        mocker.patch("main._test_encoder", return_value=True)
+        mocker.patch(
+            "main._list_ffmpeg_encoders",
+            return_value={"hevc_videotoolbox", "h264_videotoolbox"},
+        )
 
         playlist_data = {
             "created": "2024-01-01T00:00:00",
@@ -209,7 +301,10 @@ class TestCompileMovie:
 
     def test_landscape_video_uses_pad_filter(self, mocker, mock_console, tmp_path):
         """Test that landscape videos use pad filter."""
-        mocker.patch("main._test_encoder", return_value=True)
+        mocker.patch(
+            "main._list_ffmpeg_encoders",
+            return_value={"hevc_videotoolbox", "h264_videotoolbox"},
+        )
 
         playlist_data = {
             "created": "2024-01-01T00:00:00",
@@ -312,7 +407,10 @@ class TestCompileMovie:
 
     def test_includes_aac_audio_codec(self, mocker, mock_console, sample_playlist):
         """Test that AAC audio codec is specified."""
-        mocker.patch("main._test_encoder", return_value=True)
+        mocker.patch(
+            "main._list_ffmpeg_encoders",
+            return_value={"hevc_videotoolbox", "h264_videotoolbox"},
+        )
 
         mock_popen = MagicMock()
         mock_popen.stdout = iter([])
@@ -332,7 +430,10 @@ class TestCompileMovie:
 
     def test_includes_faststart_flag(self, mocker, mock_console, sample_playlist):
         """Test that faststart flag is included for web playback."""
-        mocker.patch("main._test_encoder", return_value=True)
+        mocker.patch(
+            "main._list_ffmpeg_encoders",
+            return_value={"hevc_videotoolbox", "h264_videotoolbox"},
+        )
 
         mock_popen = MagicMock()
         mock_popen.stdout = iter([])
@@ -354,7 +455,10 @@ class TestCompileMovie:
         self, mocker, mock_console, sample_playlist_multiple_videos
     ):
         """Test that multiple videos include xfade transitions."""
-        mocker.patch("main._test_encoder", return_value=True)
+        mocker.patch(
+            "main._list_ffmpeg_encoders",
+            return_value={"hevc_videotoolbox", "h264_videotoolbox"},
+        )
 
         mock_popen = MagicMock()
         mock_popen.stdout = iter([])
@@ -377,7 +481,10 @@ class TestCompileMovie:
         self, mocker, mock_console, sample_playlist
     ):
         """Test handling of general exceptions."""
-        mocker.patch("main._test_encoder", return_value=True)
+        mocker.patch(
+            "main._list_ffmpeg_encoders",
+            return_value={"hevc_videotoolbox", "h264_videotoolbox"},
+        )
         mocker.patch("main.subprocess.Popen", side_effect=Exception("Unexpected error"))
 
         result = compile_movie(sample_playlist)
@@ -386,7 +493,10 @@ class TestCompileMovie:
 
     def test_rotation_90_applies_transpose(self, mocker, mock_console, tmp_path):
         """Test that 90 degree rotation applies transpose=1 filter."""
-        mocker.patch("main._test_encoder", return_value=True)
+        mocker.patch(
+            "main._list_ffmpeg_encoders",
+            return_value={"hevc_videotoolbox", "h264_videotoolbox"},
+        )
 
         playlist_data = {
             "created": "2024-01-01T00:00:00",
@@ -430,11 +540,12 @@ class TestCompileMovie:
 
         assert "transpose=1" in filter_str
 
-    def test_rotation_180_applies_double_transpose(
-        self, mocker, mock_console, tmp_path
-    ):
-        """Test that 180 degree rotation applies transpose=1,transpose=1 filter."""
-        mocker.patch("main._test_encoder", return_value=True)
+    def test_rotation_180_applies_hflip_vflip(self, mocker, mock_console, tmp_path):
+        """Test that 180 degree rotation applies the hflip,vflip filter."""
+        mocker.patch(
+            "main._list_ffmpeg_encoders",
+            return_value={"hevc_videotoolbox", "h264_videotoolbox"},
+        )
 
         playlist_data = {
             "created": "2024-01-01T00:00:00",
@@ -476,11 +587,14 @@ class TestCompileMovie:
         filter_idx = cmd.index("-filter_complex") + 1
         filter_str = cmd[filter_idx]
 
-        assert "transpose=1,transpose=1" in filter_str
+        assert "hflip,vflip" in filter_str
 
     def test_rotation_270_applies_transpose_2(self, mocker, mock_console, tmp_path):
         """Test that 270 degree rotation applies transpose=2 filter."""
-        mocker.patch("main._test_encoder", return_value=True)
+        mocker.patch(
+            "main._list_ffmpeg_encoders",
+            return_value={"hevc_videotoolbox", "h264_videotoolbox"},
+        )
 
         playlist_data = {
             "created": "2024-01-01T00:00:00",
@@ -526,7 +640,10 @@ class TestCompileMovie:
 
     def test_no_rotation_no_transpose(self, mocker, mock_console, sample_playlist):
         """Test that videos without rotation don't have transpose filter."""
-        mocker.patch("main._test_encoder", return_value=True)
+        mocker.patch(
+            "main._list_ffmpeg_encoders",
+            return_value={"hevc_videotoolbox", "h264_videotoolbox"},
+        )
 
         mock_popen = MagicMock()
         mock_popen.stdout = iter([])
@@ -546,7 +663,10 @@ class TestCompileMovie:
 
     def test_portrait_with_rotation(self, mocker, mock_console, tmp_path):
         """Test that portrait videos with rotation apply both blur and transpose."""
-        mocker.patch("main._test_encoder", return_value=True)
+        mocker.patch(
+            "main._list_ffmpeg_encoders",
+            return_value={"hevc_videotoolbox", "h264_videotoolbox"},
+        )
 
         playlist_data = {
             "created": "2024-01-01T00:00:00",
@@ -591,3 +711,706 @@ class TestCompileMovie:
         # Should have both blur (portrait) and transpose (rotation)
         assert "gblur" in filter_str
         assert "transpose=1" in filter_str
+
+
+def make_playlist_entry(
+    uuid: str = "clip-001",
+    width: int = 1920,
+    height: int = 1080,
+    codec: str | None = "hevc",
+    fps: float | None = 30.0,
+    rotation: int = 0,
+    path: str = "/path/to/video.mov",
+    duration: float = 30.0,
+) -> dict:
+    """Factory for playlist video entries used by uniformity tests."""
+    return {
+        "uuid": uuid,
+        "date": "2024-01-01T10:00:00",
+        "duration": duration,
+        "filename": f"{uuid}.mov",
+        "persons": [],
+        "is_portrait": height > width,
+        "width": width,
+        "height": height,
+        "codec": codec,
+        "fps": fps,
+        "path": path,
+        "rotation": rotation,
+    }
+
+
+class TestClipsAreUniform:
+    """Tests for _clips_are_uniform() stream-copy eligibility check."""
+
+    def test_uniform_entries(self):
+        """Identical codec/size/fps across entries is uniform."""
+        videos = [make_playlist_entry(uuid=f"clip-{i}") for i in range(3)]
+        assert _clips_are_uniform(videos) is True
+
+    def test_empty_list_not_uniform(self):
+        assert _clips_are_uniform([]) is False
+
+    def test_mixed_dimensions_not_uniform(self):
+        videos = [
+            make_playlist_entry(uuid="clip-1"),
+            make_playlist_entry(uuid="clip-2", width=1080, height=1920),
+        ]
+        assert _clips_are_uniform(videos) is False
+
+    def test_mixed_codec_not_uniform(self):
+        videos = [
+            make_playlist_entry(uuid="clip-1", codec="hevc"),
+            make_playlist_entry(uuid="clip-2", codec="avc1"),
+        ]
+        assert _clips_are_uniform(videos) is False
+
+    def test_mixed_fps_not_uniform(self):
+        videos = [
+            make_playlist_entry(uuid="clip-1", fps=30.0),
+            make_playlist_entry(uuid="clip-2", fps=60.0),
+        ]
+        assert _clips_are_uniform(videos) is False
+
+    def test_unknown_codec_not_uniform(self):
+        """Entries without codec metadata never qualify for stream copy."""
+        videos = [make_playlist_entry(uuid=f"clip-{i}", codec=None) for i in range(2)]
+        assert _clips_are_uniform(videos) is False
+
+    def test_rotated_entry_not_uniform(self):
+        """A rotated clip always needs a re-encode."""
+        videos = [
+            make_playlist_entry(uuid="clip-1"),
+            make_playlist_entry(uuid="clip-2", rotation=90),
+        ]
+        assert _clips_are_uniform(videos) is False
+
+
+class TestStreamCopyFastPath:
+    """Tests for the --no-transitions concat-demuxer fast path."""
+
+    @pytest.fixture
+    def uniform_playlist(self, tmp_path):
+        """Playlist whose clips all share codec/size/fps."""
+        playlist_data = {
+            "created": "2024-01-01T00:00:00",
+            "project_name": "uniform_test",
+            "filters": {
+                "start_date": "2024-01-01T00:00:00",
+                "end_date": "2024-01-02T23:59:59",
+            },
+            "videos": [
+                make_playlist_entry(uuid="clip-1", path="/path/to/clip1.mov"),
+                make_playlist_entry(uuid="clip-2", path="/path/to/clip2.mov"),
+            ],
+        }
+        playlist_path = tmp_path / "playlist.json"
+        playlist_path.write_text(json.dumps(playlist_data))
+        return playlist_path
+
+    @pytest.fixture
+    def cpu_encoding(self):
+        return EncodingSelection(
+            encoder_type="cpu",
+            quality_tier="balanced",
+            encoder_name="libx265",
+            encoder_settings=_get_encoder_settings("libx265"),
+        )
+
+    def test_uniform_clips_use_stream_copy(
+        self, mocker, mock_console, uniform_playlist, cpu_encoding
+    ):
+        """Uniform clips with transitions disabled go through -c copy."""
+        mock_run = mocker.patch("main.subprocess.run")
+
+        compile_movie(uniform_playlist, cpu_encoding, use_transitions=False)
+
+        cmd = mock_run.call_args[0][0]
+        assert "concat" in cmd
+        assert "copy" in cmd
+        assert "-filter_complex" not in cmd
+
+    def test_concat_list_contains_all_clips(
+        self, mocker, mock_console, uniform_playlist, cpu_encoding
+    ):
+        """The concat list file enumerates every clip in order."""
+        seen = {}
+
+        def record_list(cmd, **kwargs):
+            list_path = Path(cmd[cmd.index("-i") + 1])
+            seen["content"] = list_path.read_text()
+            return MagicMock()
+
+        mocker.patch("main.subprocess.run", side_effect=record_list)
+
+        compile_movie(uniform_playlist, cpu_encoding, use_transitions=False)
+
+        assert "file '/path/to/clip1.mov'" in seen["content"]
+        assert "file '/path/to/clip2.mov'" in seen["content"]
+
+    def test_concat_list_cleaned_up(
+        self, mocker, mock_console, uniform_playlist, cpu_encoding
+    ):
+        """The temporary concat list is removed after the run."""
+        mocker.patch("main.subprocess.run")
+
+        compile_movie(uniform_playlist, cpu_encoding, use_transitions=False)
+
+        assert not list(uniform_playlist.parent.glob("concat_list.txt"))
+
+    def test_missing_metadata_backfilled_via_ffprobe(
+        self, mocker, mock_console, tmp_path, cpu_encoding
+    ):
+        """Entries without codec/fps are probed and cached into the playlist."""
+        playlist_data = {
+            "created": "2024-01-01T00:00:00",
+            "project_name": "legacy_test",
+            "filters": {
+                "start_date": "2024-01-01T00:00:00",
+                "end_date": "2024-01-02T23:59:59",
+            },
+            "videos": [
+                make_playlist_entry(uuid="old-1", path="/old/clip1.mov", codec=None),
+                make_playlist_entry(uuid="old-2", path="/old/clip2.mov", codec=None),
+            ],
+        }
+        playlist_path = tmp_path / "playlist.json"
+        playlist_path.write_text(json.dumps(playlist_data))
+
+        mocker.patch(
+            "main._probe_clip_signature",
+            return_value={"codec": "hevc", "width": 1920, "height": 1080, "fps": 30},
+        )
+        mock_run = mocker.patch("main.subprocess.run")
+
+        compile_movie(playlist_path, cpu_encoding, use_transitions=False)
+
+        # Probed metadata made the clips uniform, enabling stream copy
+        cmd = mock_run.call_args[0][0]
+        assert "copy" in cmd
+
+        # And the probe results were cached back into playlist.json
+        cached = json.loads(playlist_path.read_text())
+        assert cached["videos"][0]["codec"] == "hevc"
+        assert cached["videos"][1]["fps"] == 30
+
+    def test_nonuniform_clips_fall_back_to_reencode(
+        self, mocker, mock_console, sample_playlist_multiple_videos, cpu_encoding
+    ):
+        """Mixed portrait/landscape clips re-encode even with --no-transitions."""
+        mock_popen = MagicMock()
+        mock_popen.stdout = iter([])
+        mock_popen.wait.return_value = None
+        mock_popen.returncode = 0
+        mocker.patch("main.subprocess.Popen", return_value=mock_popen)
+
+        compile_movie(
+            sample_playlist_multiple_videos, cpu_encoding, use_transitions=False
+        )
+
+        import main
+
+        cmd = main.subprocess.Popen.call_args[0][0]
+        assert "-filter_complex" in cmd
+
+    def test_transitions_enabled_never_stream_copies(
+        self, mocker, mock_console, uniform_playlist, cpu_encoding
+    ):
+        """Default (transitions on) keeps the xfade re-encode pipeline."""
+        mock_popen = MagicMock()
+        mock_popen.stdout = iter([])
+        mock_popen.wait.return_value = None
+        mock_popen.returncode = 0
+        mocker.patch("main.subprocess.Popen", return_value=mock_popen)
+
+        compile_movie(uniform_playlist, cpu_encoding)
+
+        import main
+
+        cmd = main.subprocess.Popen.call_args[0][0]
+        assert "-filter_complex" in cmd
+        assert "xfade" in cmd[cmd.index("-filter_complex") + 1]
+
+    def test_ffmpeg_failure_returns_none(
+        self, mocker, mock_console, uniform_playlist, cpu_encoding
+    ):
+        """A failing stream-copy run reports failure."""
+        mocker.patch(
+            "main.subprocess.run",
+            side_effect=subprocess.CalledProcessError(1, "ffmpeg"),
+        )
+
+        result = compile_movie(uniform_playlist, cpu_encoding, use_transitions=False)
+
+        assert result is None
+
+
+class TestCompileSegmented:
+    """Tests for the --segmented two-stage compile path."""
+
+    @pytest.fixture(autouse=True)
+    def clear_encoder_cache(self, mocker):
+        """Same isolation as TestCompileMovie."""
+        _encoder_cache.clear()
+        mocker.patch("main._load_encoder_cache")
+        mocker.patch("main._save_encoder_cache")
+        mocker.patch("main._list_ffmpeg_hwaccels", return_value={"videotoolbox"})
+        yield
+        _encoder_cache.clear()
+
+    @pytest.fixture
+    def cpu_encoding(self):
+        return EncodingSelection(
+            encoder_type="cpu",
+            quality_tier="balanced",
+            encoder_name="libx265",
+            encoder_settings=_get_encoder_settings("libx265"),
+        )
+
+    def _mock_progress(self, mocker):
+        """Mock Progress to avoid Rich internals issues with MagicMock."""
+        mock_progress = MagicMock()
+        mock_progress.__enter__ = MagicMock(return_value=mock_progress)
+        mock_progress.__exit__ = MagicMock(return_value=False)
+        mocker.patch("main.Progress", return_value=mock_progress)
+
+    @pytest.fixture
+    def two_clip_playlist(self, tmp_path):
+        playlist_data = {
+            "created": "2024-01-01T00:00:00",
+            "project_name": "segmented_test",
+            "filters": {
+                "start_date": "2024-01-01T00:00:00",
+                "end_date": "2024-01-02T23:59:59",
+            },
+            "videos": [
+                make_playlist_entry(uuid="seg-1", path="/path/to/clip1.mov"),
+                make_playlist_entry(uuid="seg-2", path="/path/to/clip2.mov"),
+            ],
+        }
+        playlist_path = tmp_path / "playlist.json"
+        playlist_path.write_text(json.dumps(playlist_data))
+        return playlist_path
+
+    def test_one_normalize_pass_per_clip(
+        self, mocker, mock_console, two_clip_playlist, cpu_encoding
+    ):
+        """Stage one runs a separate ffmpeg process for each clip."""
+        self._mock_progress(mocker)
+        mock_run = mocker.patch(
+            "main.subprocess.run", return_value=MagicMock(returncode=0)
+        )
+        mock_popen = MagicMock()
+        mock_popen.stdout = iter([])
+        mock_popen.wait.return_value = None
+        mock_popen.returncode = 0
+        mocker.patch("main.subprocess.Popen", return_value=mock_popen)
+
+        compile_movie(two_clip_playlist, cpu_encoding, segmented=True)
+
+        assert mock_run.call_count == 2
+        for call in mock_run.call_args_list:
+            cmd = call[0][0]
+            assert cmd[0] == "ffmpeg"
+            assert "-filter_complex" in cmd
+
+    def test_final_pass_contains_only_xfades(
+        self, mocker, mock_console, two_clip_playlist, cpu_encoding
+    ):
+        """The join pass crossfades intermediates without normalize filters."""
+        self._mock_progress(mocker)
+        mocker.patch("main.subprocess.run", return_value=MagicMock(returncode=0))
+        mock_popen = MagicMock()
+        mock_popen.stdout = iter([])
+        mock_popen.wait.return_value = None
+        mock_popen.returncode = 0
+        mocker.patch("main.subprocess.Popen", return_value=mock_popen)
+
+        compile_movie(two_clip_playlist, cpu_encoding, segmented=True)
+
+        import main
+
+        cmd = main.subprocess.Popen.call_args[0][0]
+        filter_str = cmd[cmd.index("-filter_complex") + 1]
+        assert "xfade" in filter_str
+        assert "acrossfade" in filter_str
+        assert "scale=" not in filter_str
+
+    def test_failed_segment_aborts(
+        self, mocker, mock_console, two_clip_playlist, cpu_encoding
+    ):
+        """A failed normalize pass aborts instead of joining partial output."""
+        self._mock_progress(mocker)
+        mocker.patch("main.subprocess.run", return_value=MagicMock(returncode=1))
+        mock_popen_cls = mocker.patch("main.subprocess.Popen")
+
+        result = compile_movie(two_clip_playlist, cpu_encoding, segmented=True)
+
+        assert result is None
+        mock_popen_cls.assert_not_called()
+
+    def test_single_clip_uses_normal_path(
+        self, mocker, mock_console, tmp_path, cpu_encoding
+    ):
+        """Segmented mode is pointless for one clip; use the single pass."""
+        playlist_data = {
+            "created": "2024-01-01T00:00:00",
+            "project_name": "single_test",
+            "filters": {
+                "start_date": "2024-01-01T00:00:00",
+                "end_date": "2024-01-01T23:59:59",
+            },
+            "videos": [
+                make_playlist_entry(uuid="only", path="/path/to/only.mov", fps=60.0)
+            ],
+        }
+        playlist_path = tmp_path / "playlist.json"
+        playlist_path.write_text(json.dumps(playlist_data))
+
+        mock_run = mocker.patch("main.subprocess.run")
+        mock_popen = MagicMock()
+        mock_popen.stdout = iter([])
+        mock_popen.wait.return_value = None
+        mock_popen.returncode = 0
+        mocker.patch("main.subprocess.Popen", return_value=mock_popen)
+
+        compile_movie(playlist_path, cpu_encoding, segmented=True)
+
+        mock_run.assert_not_called()
+
+        import main
+
+        main.subprocess.Popen.assert_called_once()
+
+
+class TestRenditions:
+    """Tests for multi-rendition output from a single encode pass."""
+
+    @pytest.fixture(autouse=True)
+    def clear_encoder_cache(self, mocker):
+        """Same isolation as TestCompileMovie."""
+        _encoder_cache.clear()
+        mocker.patch("main._load_encoder_cache")
+        mocker.patch("main._save_encoder_cache")
+        mocker.patch("main._list_ffmpeg_hwaccels", return_value={"videotoolbox"})
+        yield
+        _encoder_cache.clear()
+
+    @pytest.fixture
+    def cpu_encoding(self):
+        return EncodingSelection(
+            encoder_type="cpu",
+            quality_tier="high",
+            encoder_name="libx265",
+            encoder_settings=_get_encoder_settings("libx265"),
+        )
+
+    def _compile(self, mocker, playlist, encoding, renditions):
+        mock_popen = MagicMock()
+        mock_popen.stdout = iter([])
+        mock_popen.wait.return_value = None
+        mock_popen.returncode = 0
+        mocker.patch("main.subprocess.Popen", return_value=mock_popen)
+
+        compile_movie(playlist, encoding, renditions=renditions)
+
+        import main
+
+        return main.subprocess.Popen.call_args[0][0]
+
+    def test_extra_tier_adds_split_and_second_output(
+        self, mocker, mock_console, sample_playlist, cpu_encoding
+    ):
+        """A second tier fans the graph out and adds one output block."""
+        cmd = self._compile(mocker, sample_playlist, cpu_encoding, ["fast"])
+
+        filter_str = cmd[cmd.index("-filter_complex") + 1]
+        assert "[vout]split=2[vout0][vout1]" in filter_str
+        assert "[aout]asplit=2[aout0][aout1]" in filter_str
+        assert cmd.count("-c:v") == 2
+        assert sum(1 for part in cmd if str(part).endswith(".mp4")) == 2
+        assert any("_fast.mp4" in str(part) for part in cmd)
+
+    def test_each_rendition_gets_its_own_quality(
+        self, mocker, mock_console, sample_playlist, cpu_encoding
+    ):
+        """Output blocks carry per-tier CRF values."""
+        cmd = self._compile(mocker, sample_playlist, cpu_encoding, ["fast"])
+
+        settings = _get_encoder_settings("libx265")
+        crf_positions = [i for i, part in enumerate(cmd) if part == "-crf"]
+        assert cmd[crf_positions[0] + 1] == settings["quality_values"]["high"]
+        assert cmd[crf_positions[1] + 1] == settings["quality_values"]["fast"]
+
+    def test_no_renditions_keeps_single_output(
+        self, mocker, mock_console, sample_playlist, cpu_encoding
+    ):
+        """Without extra tiers the command is unchanged: no split, one file."""
+        cmd = self._compile(mocker, sample_playlist, cpu_encoding, None)
+
+        filter_str = cmd[cmd.index("-filter_complex") + 1]
+        assert "split=" not in filter_str
+        assert cmd.count("-c:v") == 1
+
+    def test_duplicate_tier_is_dropped(
+        self, mocker, mock_console, sample_playlist, cpu_encoding
+    ):
+        """Requesting the primary tier again must not double the output."""
+        cmd = self._compile(mocker, sample_playlist, cpu_encoding, ["high"])
+
+        assert cmd.count("-c:v") == 1
+
+
+class TestMatchesTarget:
+    """Tests for the target-format passthrough check."""
+
+    def test_matching_clip_skips_scaler(self, mocker, mock_console, tmp_path):
+        """1920x1080@30 landscape clips get metadata-only filters."""
+        playlist_data = {
+            "created": "2024-01-01T00:00:00",
+            "project_name": "passthrough_test",
+            "filters": {
+                "start_date": "2024-01-01T00:00:00",
+                "end_date": "2024-01-01T23:59:59",
+            },
+            "videos": [
+                make_playlist_entry(uuid="match-1", path="/path/to/m1.mov", fps=30.0),
+                make_playlist_entry(uuid="match-2", path="/path/to/m2.mov", fps=30.0),
+            ],
+        }
+        playlist_path = tmp_path / "playlist.json"
+        playlist_path.write_text(json.dumps(playlist_data))
+
+        mock_popen = MagicMock()
+        mock_popen.stdout = iter([])
+        mock_popen.wait.return_value = None
+        mock_popen.returncode = 0
+        mocker.patch("main.subprocess.Popen", return_value=mock_popen)
+        mocker.patch("main._load_encoder_cache")
+        mocker.patch("main._save_encoder_cache")
+        mocker.patch("main._list_ffmpeg_hwaccels", return_value={"videotoolbox"})
+
+        encoding = EncodingSelection(
+            encoder_type="cpu",
+            quality_tier="balanced",
+            encoder_name="libx265",
+            encoder_settings=_get_encoder_settings("libx265"),
+        )
+        compile_movie(playlist_path, encoding)
+
+        import main
+
+        cmd = main.subprocess.Popen.call_args[0][0]
+        filter_str = cmd[cmd.index("-filter_complex") + 1]
+        assert "[0:v]setsar=1,settb=AVTB[v0]" in filter_str
+        assert "[1:v]setsar=1,settb=AVTB[v1]" in filter_str
+        assert "scale=" not in filter_str
+        assert "xfade" in filter_str
+
+    def test_requires_exact_geometry_and_fps(self):
+        from main import _matches_target
+
+        assert _matches_target({"width": 1920, "height": 1080, "fps": 30.0})
+        assert not _matches_target({"width": 1280, "height": 720, "fps": 30.0})
+        assert not _matches_target({"width": 1920, "height": 1080, "fps": 59.94})
+        # Unknown fps must not take the passthrough path
+        assert not _matches_target({"width": 1920, "height": 1080, "fps": None})
+
+    def test_rotated_clip_still_uses_full_filter(self, mocker, mock_console, tmp_path):
+        """Rotation needs the real filter chain even at target geometry."""
+        playlist_data = {
+            "created": "2024-01-01T00:00:00",
+            "project_name": "rotated_test",
+            "filters": {
+                "start_date": "2024-01-01T00:00:00",
+                "end_date": "2024-01-01T23:59:59",
+            },
+            "videos": [make_playlist_entry(uuid="rot", fps=30.0, rotation=90)],
+        }
+        playlist_path = tmp_path / "playlist.json"
+        playlist_path.write_text(json.dumps(playlist_data))
+
+        mock_popen = MagicMock()
+        mock_popen.stdout = iter([])
+        mock_popen.wait.return_value = None
+        mock_popen.returncode = 0
+        mocker.patch("main.subprocess.Popen", return_value=mock_popen)
+        mocker.patch("main._load_encoder_cache")
+        mocker.patch("main._save_encoder_cache")
+        mocker.patch("main._list_ffmpeg_hwaccels", return_value={"videotoolbox"})
+
+        encoding = EncodingSelection(
+            encoder_type="cpu",
+            quality_tier="balanced",
+            encoder_name="libx265",
+            encoder_settings=_get_encoder_settings("libx265"),
+        )
+        compile_movie(playlist_path, encoding)
+
+        import main
+
+        cmd = main.subprocess.Popen.call_args[0][0]
+        filter_str = cmd[cmd.index("-filter_complex") + 1]
+        assert "transpose=1" in filter_str
+        assert "scale=" in filter_str
+
+
+class TestSingleClipRemux:
+    """Tests for the single-clip stream-copy fast path."""
+
+    def _playlist(self, tmp_path, entry):
+        playlist_data = {
+            "created": "2024-01-01T00:00:00",
+            "project_name": "single_remux",
+            "filters": {
+                "start_date": "2024-01-01T00:00:00",
+                "end_date": "2024-01-01T23:59:59",
+            },
+            "videos": [entry],
+        }
+        playlist_path = tmp_path / "playlist.json"
+        playlist_path.write_text(json.dumps(playlist_data))
+        return playlist_path
+
+    def test_matching_single_clip_stream_copies(self, mocker, mock_console, tmp_path):
+        """A lone target-format clip remuxes instead of re-encoding."""
+        playlist_path = self._playlist(
+            tmp_path, make_playlist_entry(uuid="solo", fps=30.0)
+        )
+        mock_run = mocker.patch(
+            "main.subprocess.run", return_value=MagicMock(returncode=0)
+        )
+        mock_popen = mocker.patch("main.subprocess.Popen")
+
+        encoding = EncodingSelection(
+            encoder_type="cpu",
+            quality_tier="balanced",
+            encoder_name="libx265",
+            encoder_settings=_get_encoder_settings("libx265"),
+        )
+        compile_movie(playlist_path, encoding)
+
+        mock_popen.assert_not_called()
+        cmd = mock_run.call_args[0][0]
+        assert "concat" in cmd
+        copy_idx = cmd.index("-c")
+        assert cmd[copy_idx + 1] == "copy"
+
+    def test_portrait_single_clip_still_encodes(self, mocker, mock_console, tmp_path):
+        """Portrait clips need the blur pipeline even at target fps."""
+        playlist_path = self._playlist(
+            tmp_path,
+            make_playlist_entry(uuid="tall", width=1080, height=1920, fps=30.0),
+        )
+        mock_run = mocker.patch("main.subprocess.run")
+        mock_popen = MagicMock()
+        mock_popen.stdout = iter([])
+        mock_popen.wait.return_value = None
+        mock_popen.returncode = 0
+        mocker.patch("main.subprocess.Popen", return_value=mock_popen)
+        mocker.patch("main._load_encoder_cache")
+        mocker.patch("main._save_encoder_cache")
+        mocker.patch("main._list_ffmpeg_hwaccels", return_value={"videotoolbox"})
+
+        encoding = EncodingSelection(
+            encoder_type="cpu",
+            quality_tier="balanced",
+            encoder_name="libx265",
+            encoder_settings=_get_encoder_settings("libx265"),
+        )
+        compile_movie(playlist_path, encoding)
+
+        mock_run.assert_not_called()
+
+        import main
+
+        main.subprocess.Popen.assert_called_once()
+
+
+class TestXfadeFilterParts:
+    """Tests for the shared xfade chain builder."""
+
+    def _videos(self, *durations):
+        return [
+            make_playlist_entry(uuid=f"clip-{i}", duration=d)
+            for i, d in enumerate(durations)
+        ]
+
+    def test_offsets_accumulate_minus_transitions(self):
+        """Each fade starts at summed durations minus prior overlaps."""
+        from main import TRANSITION_DURATION, _xfade_filter_parts
+
+        parts = _xfade_filter_parts(self._videos(10.0, 20.0, 30.0), "[v{i}]", "[a{i}]")
+
+        xfades = [p for p in parts if "xfade" in p and "acrossfade" not in p]
+        assert f"offset={10.0 - TRANSITION_DURATION:.3f}" in xfades[0]
+        assert f"offset={30.0 - 2 * TRANSITION_DURATION:.3f}" in xfades[1]
+
+    def test_chain_labels(self):
+        """First pair reads the input labels, later pairs the vt/at chain."""
+        from main import _xfade_filter_parts
+
+        parts = _xfade_filter_parts(self._videos(5.0, 5.0, 5.0), "[v{i}]", "[a{i}]")
+
+        assert parts[0].startswith("[v0][v1]")
+        assert parts[0].endswith("[vt0]")
+        assert parts[2].startswith("[vt0][v2]")
+        assert parts[2].endswith("[vout]")
+        assert parts[3].endswith("[aout]")
+
+    def test_two_clips_single_fade_to_out(self):
+        from main import _xfade_filter_parts
+
+        parts = _xfade_filter_parts(self._videos(5.0, 5.0), "[{i}:v]", "[{i}:a]")
+
+        assert len(parts) == 2
+        assert parts[0].startswith("[0:v][1:v]")
+        assert parts[0].endswith("[vout]")
+
+
+class TestCpuThreadFlags:
+    """Tests for libx265 threading flags."""
+
+    def _compile(self, mocker, playlist, encoding):
+        mock_popen = MagicMock()
+        mock_popen.stdout = iter([])
+        mock_popen.wait.return_value = None
+        mock_popen.returncode = 0
+        mocker.patch("main.subprocess.Popen", return_value=mock_popen)
+        mocker.patch("main._load_encoder_cache")
+        mocker.patch("main._save_encoder_cache")
+        mocker.patch("main._list_ffmpeg_hwaccels", return_value={"videotoolbox"})
+
+        compile_movie(playlist, encoding)
+
+        import main
+
+        return main.subprocess.Popen.call_args[0][0]
+
+    def test_libx265_gets_thread_flags(self, mocker, mock_console, sample_playlist):
+        encoding = EncodingSelection(
+            encoder_type="cpu",
+            quality_tier="balanced",
+            encoder_name="libx265",
+            encoder_settings=_get_encoder_settings("libx265"),
+        )
+        cmd = self._compile(mocker, sample_playlist, encoding)
+
+        assert "-filter_complex_threads" in cmd
+        threads_idx = cmd.index("-threads")
+        assert cmd[threads_idx + 1] == "0"
+
+    def test_videotoolbox_skips_thread_flags(
+        self, mocker, mock_console, sample_playlist
+    ):
+        """The hardware encoder runs on the media engine, not CPU threads."""
+        encoding = EncodingSelection(
+            encoder_type="gpu",
+            quality_tier="balanced",
+            encoder_name="hevc_videotoolbox",
+            encoder_settings=_get_encoder_settings("hevc_videotoolbox"),
+        )
+        cmd = self._compile(mocker, sample_playlist, encoding)
+
+        assert "-filter_complex_threads" not in cmd
+        assert "-threads" not in cmd
@@ -1,20 +1,9 @@
 """Tests for video filtering functions."""
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-import os
-
-# Import helper function - conftest.py is in the same directory
-import sys
+from conftest import create_mock_video
 
 from main import filter_by_duration, filter_by_people, get_unique_persons
 
-sys.path.insert(0, os.path.dirname(__file__))
-from conftest import create_mock_video
-
 
 class TestGetUniquePersons:
     """Tests for get_unique_persons() function."""